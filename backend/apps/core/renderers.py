@@ -0,0 +1,43 @@
+"""
+Custom renderers for DRF.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Types orjson cannot encode natively (Decimal, lazy strings, timedelta,
+# ...) fall back to DRF's encoder so the output matches JSONRenderer.
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Produces the same documents as DRF's JSONRenderer, but encodes in C
+    instead of through the pure-Python json encoder. Datetimes are passed
+    through to DRF's encoder so their format is unchanged.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON bytes.
+
+        Args:
+            data: The data to render
+            accepted_media_type: The negotiated media type
+            renderer_context: Extra context supplied by the view
+
+        Returns:
+            bytes: The encoded JSON document
+        """
+        if data is None:
+            return b''
+
+        return orjson.dumps(data, default=_fallback_encoder.default, option=self.options)
@@ -3,12 +3,12 @@ URL routing for users app.
 """
 
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from apps.users.views import UserViewSet
 
 # Create router and register viewsets
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'users', UserViewSet, basename='user')
 
 # URL patterns
@@ -259,10 +259,9 @@ class UserViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        vouchers = user.created_vouchers.select_related('created_by').all()
-
         # Import here to avoid circular dependency
         from apps.vouchers.serializers import VoucherListSerializer
+        vouchers = VoucherListSerializer.setup_eager_loading(user.created_vouchers.all())
         serializer = VoucherListSerializer(vouchers, many=True)
 
         return Response(serializer.data)
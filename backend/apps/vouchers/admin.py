@@ -51,9 +51,12 @@ class VoucherParentAdmin(PolymorphicParentModelAdmin):
     def get_queryset(self, request):
         """
         Optimize queryset with select_related to prevent N+1 queries.
+
+        The changelist lists non-polymorphic base rows, so only the long
+        description column is worth deferring.
         """
         qs = super().get_queryset(request)
-        return qs.select_related('created_by')
+        return qs.select_related('created_by').defer('description')
 
 
 @admin.register(VoucherUsage)
@@ -1,6 +1,67 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.signals import request_started
+from django.db.models.signals import post_delete, post_save
+
+_WARM_CONTENT_TYPES_UID = 'vouchers.warm_content_types'
+_USER_SAVED_UID = 'vouchers.invalidate_lists_on_user_save'
+_USER_DELETED_UID = 'vouchers.invalidate_lists_on_user_delete'
+
+# User fields rendered in voucher lists through created_by_name.
+_CREATOR_NAME_FIELDS = frozenset({'first_name', 'last_name', 'email'})
+
+
+def warm_content_types(sender, **kwargs):
+    """
+    Load every voucher content type into the ContentType cache at once.
+
+    Runs on the first request only. Polymorphic saves and voucher_type
+    lookups then hit the cache instead of issuing one query per model.
+    """
+    request_started.disconnect(dispatch_uid=_WARM_CONTENT_TYPES_UID)
+
+    from django.contrib.contenttypes.models import ContentType
+
+    from apps.vouchers.models import Voucher
+
+    models = [Voucher, *Voucher.__subclasses__()]
+    ContentType.objects.get_for_models(*models, for_concrete_models=False)
+
+
+def invalidate_lists_for_user(sender, created=False, update_fields=None, **kwargs):
+    """
+    Drop cached voucher list pages when a voucher creator's name may change.
+
+    New users have created no vouchers yet, and saves limited to other
+    fields (such as last_login on login) cannot change created_by_name.
+    Deleting a user nulls created_by on their vouchers with an UPDATE that
+    bypasses Voucher.save(), so deletes invalidate too.
+    """
+    if created:
+        return
+    if update_fields is not None and _CREATOR_NAME_FIELDS.isdisjoint(update_fields):
+        return
+
+    from apps.vouchers.models.managers import invalidate_voucher_lists
+
+    invalidate_voucher_lists()
 
 
 class VouchersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.vouchers"
+
+    def ready(self):
+        # Deferred to the first request: querying during app loading is
+        # unsafe before migrations have run.
+        request_started.connect(warm_content_types, dispatch_uid=_WARM_CONTENT_TYPES_UID)
+        post_save.connect(
+            invalidate_lists_for_user,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid=_USER_SAVED_UID,
+        )
+        post_delete.connect(
+            invalidate_lists_for_user,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid=_USER_DELETED_UID,
+        )
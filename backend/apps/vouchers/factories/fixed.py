@@ -5,6 +5,7 @@ FixedAmountVoucher factory for testing.
 from decimal import Decimal
 
 import factory
+from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from factory.django import DjangoModelFactory
 
@@ -49,10 +50,7 @@ class FixedAmountVoucherFactory(DjangoModelFactory):
 
     created_by = factory.SubFactory('apps.users.factories.UserFactory')
 
-    @factory.lazy_attribute
-    def created_by(self):
-        """
-        Create a user for created_by if not provided.
-        """
-        from apps.users.factories import UserFactory
-        return UserFactory()
+    # Resolved through the ContentType cache so build() instances carry it too
+    polymorphic_ctype = factory.LazyFunction(
+        lambda: ContentType.objects.get_for_model(FixedAmountVoucher, for_concrete_model=False)
+    )
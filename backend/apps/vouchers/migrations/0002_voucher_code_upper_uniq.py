@@ -0,0 +1,21 @@
+# Generated by Django 5.1.3 on 2026-10-16 09:12
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vouchers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="voucher",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Upper("code"),
+                name="vouchers_code_upper_uniq",
+            ),
+        ),
+    ]
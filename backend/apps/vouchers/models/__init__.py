@@ -3,8 +3,10 @@ Voucher models package.
 """
 
 from apps.vouchers.models.base import Voucher
+from apps.vouchers.models.dispatch import calculate
 from apps.vouchers.models.fixed_amount import FixedAmountVoucher
 from apps.vouchers.models.free_shipping import FreeShippingVoucher
+from apps.vouchers.models.managers import VoucherManager, VoucherQuerySet
 from apps.vouchers.models.percentage_discount import PercentageDiscountVoucher
 from apps.vouchers.models.usage import VoucherUsage
 
@@ -14,4 +16,7 @@ __all__ = [
     'FixedAmountVoucher',
     'FreeShippingVoucher',
     'VoucherUsage',
+    'VoucherManager',
+    'VoucherQuerySet',
+    'calculate',
 ]
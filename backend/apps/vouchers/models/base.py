@@ -3,13 +3,31 @@ Base voucher model using django-polymorphic for inheritance.
 """
 
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from polymorphic.models import PolymorphicModel
 
 from apps.core.models import TimeStampedModel
 from apps.vouchers.enums import VoucherStatus
+from apps.vouchers.models.managers import (
+    VoucherManager,
+    invalidate_voucher_lists,
+    status_after_increment,
+    voucher_cache_key,
+)
+
+_ACTIVE = VoucherStatus.ACTIVE
+
+_INVALID_DATE_RANGE = _('Valid until date must be after valid from date')
+
+# Memoized properties dropped when usage changes or the instance is reloaded.
+_VALIDITY_CACHE_ATTRS = ('is_valid', 'is_expired')
 
 
 class Voucher(PolymorphicModel, TimeStampedModel):
@@ -84,6 +102,8 @@ class Voucher(PolymorphicModel, TimeStampedModel):
         help_text=_('User who created this voucher')
     )
 
+    objects = VoucherManager()
+
     class Meta:
         db_table = 'vouchers'
         verbose_name = _('voucher')
@@ -93,6 +113,10 @@ class Voucher(PolymorphicModel, TimeStampedModel):
             models.Index(fields=['code', 'status']),
             models.Index(fields=['status', 'valid_from', 'valid_until']),
         ]
+        constraints = [
+            # Codes are canonicalized to uppercase; enforce it case-insensitively
+            models.UniqueConstraint(Upper('code'), name='vouchers_code_upper_uniq'),
+        ]
 
     def __str__(self):
         return f"{self.code} - {self.name}"
@@ -103,36 +127,97 @@ class Voucher(PolymorphicModel, TimeStampedModel):
         """
         super().clean()
         if self.valid_until and self.valid_from and self.valid_until <= self.valid_from:
-            from django.core.exceptions import ValidationError
-            raise ValidationError(_('Valid until date must be after valid from date'))
+            raise ValidationError(_INVALID_DATE_RANGE)
 
-    @property
+    @cached_property
     def is_valid(self):
         """
         Check if voucher is currently valid.
 
+        The result is memoized on the instance, which lives for a single
+        request, so repeated checks don't recompute it.
+
         Returns:
             Boolean indicating if voucher is valid for use
         """
-        now = timezone.now()
+        return self._is_valid_at(timezone.now())
+
+    @cached_property
+    def is_expired(self):
+        """Check if voucher has expired (memoized on the instance)."""
+        return timezone.now() > self.valid_until
+
+    def _is_valid_at(self, now):
+        """Check if voucher is valid for use at the given time."""
         return (
-            self.status == VoucherStatus.ACTIVE and
+            self.status == _ACTIVE and
             self.valid_from <= now <= self.valid_until and
             (self.usage_limit is None or self.usage_count < self.usage_limit)
         )
 
-    @property
-    def is_expired(self):
-        """Check if voucher has expired."""
-        return timezone.now() > self.valid_until
+    def prime_validity(self, now):
+        """
+        Memoize is_valid and is_expired against a single timestamp.
+
+        Values that are already memoized (or were annotated onto the
+        instance by the queryset) are kept.
+
+        Args:
+            now: Timestamp to evaluate validity against
+        """
+        self.__dict__.setdefault('is_valid', self._is_valid_at(now))
+        self.__dict__.setdefault('is_expired', now > self.valid_until)
+
+    def _clear_validity_cache(self):
+        """Drop memoized is_valid/is_expired values."""
+        for attr in _VALIDITY_CACHE_ATTRS:
+            self.__dict__.pop(attr, None)
+
+    def save(self, *args, **kwargs):
+        """
+        Save the voucher, drop memoized or annotated validity flags and
+        evict cached copies of it.
+        """
+        super().save(*args, **kwargs)
+        self._clear_validity_cache()
+        cache.delete(voucher_cache_key(self.code))
+        invalidate_voucher_lists()
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the voucher and evict it from the code lookup and list caches.
+        """
+        cache.delete(voucher_cache_key(self.code))
+        invalidate_voucher_lists()
+        return super().delete(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        """
+        Reload field values from the database and drop memoized properties.
+        """
+        super().refresh_from_db(*args, **kwargs)
+        self._clear_validity_cache()
 
     def increment_usage(self):
         """
         Increment the usage count of the voucher.
 
         This method should be called when a voucher is successfully used.
+        The database row is updated atomically with an F() expression, so
+        concurrent redemptions don't lose increments; the in-memory
+        instance is updated to match without re-reading the row.
         """
+        now = timezone.now()
+        Voucher.objects.filter(pk=self.pk).update(
+            usage_count=F('usage_count') + 1,
+            status=status_after_increment(1),
+            updated_at=now,
+        )
+
         self.usage_count += 1
         if self.usage_limit and self.usage_count >= self.usage_limit:
             self.status = VoucherStatus.USED
-        self.save(update_fields=['usage_count', 'status', 'updated_at'])
+        self.updated_at = now
+        self._clear_validity_cache()
+        cache.delete(voucher_cache_key(self.code))
+        invalidate_voucher_lists()
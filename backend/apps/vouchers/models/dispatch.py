@@ -0,0 +1,49 @@
+"""
+Type-based dispatch for voucher discount calculation.
+"""
+
+from decimal import Decimal
+from types import MappingProxyType
+
+from apps.vouchers.models.fixed_amount import FixedAmountVoucher
+from apps.vouchers.models.free_shipping import FreeShippingVoucher
+from apps.vouchers.models.percentage_discount import PercentageDiscountVoucher
+
+_ZERO = Decimal('0')
+
+
+# Concrete voucher class -> discount routine, fixed at import time. All
+# routines share the (voucher, purchase_amount, shipping_amount) signature.
+_DISPATCH = MappingProxyType({
+    PercentageDiscountVoucher: PercentageDiscountVoucher.calculate_discount,
+    FixedAmountVoucher: FixedAmountVoucher.calculate_discount,
+    FreeShippingVoucher: FreeShippingVoucher.calculate_discount,
+})
+
+
+def calculate(voucher, purchase_amount, shipping_amount=None):
+    """
+    Calculate the discount a voucher grants for a purchase.
+
+    Dispatches on the concrete voucher class through a lookup table
+    instead of method resolution on the instance.
+
+    Args:
+        voucher: A concrete voucher instance
+        purchase_amount: The total purchase amount
+        shipping_amount: The shipping cost (only used by free shipping vouchers)
+
+    Returns:
+        Decimal: The calculated discount, or 0 for unknown voucher types
+        and purchases below the voucher's minimum
+    """
+    kernel = _DISPATCH.get(type(voucher))
+    if kernel is None:
+        return _ZERO
+    # Keep the bare 0 the validate endpoint has always reported here; the
+    # per-type routines return 0.00
+    if purchase_amount < voucher.min_purchase_amount:
+        return _ZERO
+    if shipping_amount is None:
+        shipping_amount = _ZERO
+    return kernel(voucher, purchase_amount, shipping_amount)
@@ -10,6 +10,8 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.vouchers.models.base import Voucher
 
+_ZERO_AMOUNT = Decimal('0.00')
+
 
 class FixedAmountVoucher(Voucher):
     """
@@ -40,17 +42,18 @@ class FixedAmountVoucher(Voucher):
         verbose_name = _('fixed amount voucher')
         verbose_name_plural = _('fixed amount vouchers')
 
-    def calculate_discount(self, purchase_amount):
+    def calculate_discount(self, purchase_amount, shipping_amount=Decimal('0')):
         """
         Calculate the discount amount for a given purchase.
 
         Args:
             purchase_amount: The total purchase amount
+            shipping_amount: Ignored; accepted for a uniform signature
 
         Returns:
             Decimal: The calculated discount amount
         """
         if purchase_amount < self.min_purchase_amount:
-            return Decimal('0.00')
+            return _ZERO_AMOUNT
 
         return min(self.discount_amount, purchase_amount)
@@ -10,6 +10,8 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.vouchers.models.base import Voucher
 
+_ZERO_AMOUNT = Decimal('0.00')
+
 
 class FreeShippingVoucher(Voucher):
     """
@@ -42,7 +44,7 @@ class FreeShippingVoucher(Voucher):
         verbose_name = _('free shipping voucher')
         verbose_name_plural = _('free shipping vouchers')
 
-    def calculate_discount(self, purchase_amount, shipping_amount):
+    def calculate_discount(self, purchase_amount, shipping_amount=Decimal('0')):
         """
         Calculate the shipping discount for a given purchase.
 
@@ -54,7 +56,7 @@ class FreeShippingVoucher(Voucher):
             Decimal: The calculated shipping discount
         """
         if purchase_amount < self.min_purchase_amount:
-            return Decimal('0.00')
+            return _ZERO_AMOUNT
 
         if self.max_shipping_amount:
             return min(shipping_amount, self.max_shipping_amount)
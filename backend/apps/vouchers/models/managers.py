@@ -0,0 +1,217 @@
+"""
+Custom queryset and manager for the polymorphic Voucher models.
+"""
+
+import time
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+from polymorphic.managers import PolymorphicManager
+from polymorphic.query import PolymorphicQuerySet
+
+from apps.vouchers.enums import VoucherStatus
+
+# Seconds a voucher looked up by code stays in the cache.
+VOUCHER_CACHE_TIMEOUT = 60
+
+
+def voucher_cache_key(code):
+    """
+    Return the cache key for the voucher with the given code.
+    """
+    return f'voucher:{code}'
+
+
+# Seconds a rendered page of the voucher list stays in the cache.
+VOUCHER_LIST_CACHE_TIMEOUT = 60
+
+# Token embedded in every list page key; replacing it orphans all pages.
+_LIST_VERSION_KEY = 'voucher:list:version'
+
+
+def voucher_list_cache_key(scope, url):
+    """
+    Return the cache key for one page of the voucher list.
+
+    Args:
+        scope: Which vouchers the requesting user may see ('all' or 'active')
+        url: The full request URL, including filters and page number
+
+    Returns:
+        str: A key tied to the current list version
+    """
+    version = cache.get_or_set(_LIST_VERSION_KEY, time.time_ns, None)
+    return f'voucher:list:{version}:{scope}:{url}'
+
+
+def invalidate_voucher_lists():
+    """
+    Make every cached voucher list page unreachable.
+
+    A fresh token is stored rather than incremented, so a version key
+    evicted from the cache can never bring back pages of an older version.
+    """
+    cache.set(_LIST_VERSION_KEY, time.time_ns(), None)
+
+
+def status_after_increment(increment):
+    """
+    Build the status expression for an UPDATE adding increment usages.
+
+    Mirrors increment_usage(): a voucher with a usage limit becomes USED
+    once the incremented count reaches that limit. Column references see
+    the row as it was before the UPDATE.
+
+    Args:
+        increment: Expression or value added to usage_count
+
+    Returns:
+        Case expression suitable for update(status=...)
+    """
+    return Case(
+        When(
+            usage_limit__gt=0,
+            usage_count__gte=F('usage_limit') - increment,
+            then=Value(VoucherStatus.USED),
+        ),
+        default=F('status'),
+        output_field=models.CharField(),
+    )
+
+
+class VoucherQuerySet(PolymorphicQuerySet):
+    """
+    Polymorphic queryset with voucher-specific helpers.
+    """
+
+    def with_related(self):
+        """
+        Join the creator and polymorphic content type in the same query.
+
+        Returns:
+            VoucherQuerySet with created_by and polymorphic_ctype selected
+        """
+        return self.select_related('created_by', 'polymorphic_ctype')
+
+    def with_validity(self, now=None):
+        """
+        Annotate is_valid and is_expired onto each row in SQL.
+
+        Mirrors Voucher.is_valid/is_expired for a single timestamp. The
+        annotations land in the instance __dict__, so the memoized model
+        properties return them without evaluating anything in Python.
+
+        Args:
+            now: Timestamp to evaluate validity against (defaults to now)
+
+        Returns:
+            VoucherQuerySet annotated with is_valid and is_expired
+        """
+        if now is None:
+            now = timezone.now()
+        return self.annotate(
+            is_valid=Case(
+                When(
+                    Q(status=VoucherStatus.ACTIVE)
+                    & Q(valid_from__lte=now)
+                    & Q(valid_until__gte=now)
+                    & (Q(usage_limit__isnull=True) | Q(usage_count__lt=F('usage_limit'))),
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=models.BooleanField(),
+            ),
+            is_expired=Case(
+                When(valid_until__lt=now, then=Value(True)),
+                default=Value(False),
+                output_field=models.BooleanField(),
+            ),
+        )
+
+    def bulk_increment(self, pks, counts):
+        """
+        Increment the usage count of several vouchers with a single UPDATE.
+
+        Equivalent to calling increment_usage() counts[i] times on each
+        voucher in pks, including marking vouchers as used once their
+        usage limit is reached, but without a round trip per voucher.
+
+        Args:
+            pks: Primary keys of the vouchers to update
+            counts: Number of usages to add, one per primary key
+
+        Returns:
+            Number of vouchers updated
+        """
+        increments = defaultdict(int)
+        for pk, count in zip(pks, counts, strict=True):
+            increments[pk] += count
+
+        if not increments:
+            return 0
+
+        increment = Case(
+            *(When(pk=pk, then=Value(count)) for pk, count in increments.items()),
+            default=Value(0),
+            output_field=models.PositiveIntegerField(),
+        )
+
+        queryset = self.filter(pk__in=increments)
+        with transaction.atomic(using=self.db):
+            updated = queryset.update(
+                usage_count=F('usage_count') + increment,
+                status=status_after_increment(increment),
+                updated_at=timezone.now(),
+            )
+        cache.delete_many([
+            voucher_cache_key(code)
+            for code in queryset.values_list('code', flat=True)
+        ])
+        invalidate_voucher_lists()
+        return updated
+
+
+class VoucherManager(PolymorphicManager.from_queryset(VoucherQuerySet)):
+    """
+    Polymorphic manager exposing VoucherQuerySet helpers.
+    """
+
+    queryset_class = VoucherQuerySet
+
+    def get_cached(self, code):
+        """
+        Fetch a voucher by code, serving its definition from the cache.
+
+        The cached copy supplies the type, dates and discount parameters;
+        status and usage_count can change without save() (QuerySet.update(),
+        raw SQL, data migrations), so they are re-read from the database on
+        every call with a single primary key lookup. Entries expire after
+        VOUCHER_CACHE_TIMEOUT seconds and are dropped whenever the voucher
+        is saved, deleted or redeemed. Redemption must still go through the
+        database.
+
+        Args:
+            code: The (uppercased) voucher code
+
+        Returns:
+            The concrete voucher instance
+
+        Raises:
+            Voucher.DoesNotExist: If no voucher has this code
+        """
+        key = voucher_cache_key(code)
+        voucher = cache.get_or_set(key, lambda: self.get(code=code), VOUCHER_CACHE_TIMEOUT)
+
+        try:
+            voucher.status, voucher.usage_count = self.non_polymorphic().values_list(
+                'status', 'usage_count'
+            ).get(pk=voucher.pk)
+        except self.model.DoesNotExist:
+            # Deleted without going through delete()
+            cache.delete(key)
+            raise
+        voucher._clear_validity_cache()
+        return voucher
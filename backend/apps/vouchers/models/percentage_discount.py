@@ -10,6 +10,9 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.vouchers.models.base import Voucher
 
+_ZERO_AMOUNT = Decimal('0.00')
+_CENT = Decimal('0.01')
+
 
 class PercentageDiscountVoucher(Voucher):
     """
@@ -50,22 +53,34 @@ class PercentageDiscountVoucher(Voucher):
         verbose_name = _('percentage discount voucher')
         verbose_name_plural = _('percentage discount vouchers')
 
-    def calculate_discount(self, purchase_amount):
+    def calculate_discount(self, purchase_amount, shipping_amount=Decimal('0')):
         """
         Calculate the discount amount for a given purchase.
 
         Args:
             purchase_amount: The total purchase amount
+            shipping_amount: Ignored; accepted for a uniform signature
 
         Returns:
             Decimal: The calculated discount amount
         """
         if purchase_amount < self.min_purchase_amount:
-            return Decimal('0.00')
+            return _ZERO_AMOUNT
+
+        # purchase * percentage / 100 in cents is purchase * percentage;
+        # work on exact integer ratios and round half to even, as
+        # quantize() does, without intermediate Decimal arithmetic.
+        purchase_num, purchase_den = purchase_amount.as_integer_ratio()
+        percent_num, percent_den = self.discount_percentage.as_integer_ratio()
+        denominator = purchase_den * percent_den
+        cents, remainder = divmod(purchase_num * percent_num, denominator)
+        twice_remainder = 2 * remainder
+        if twice_remainder > denominator or (twice_remainder == denominator and cents % 2):
+            cents += 1
 
-        discount = purchase_amount * (self.discount_percentage / Decimal('100'))
+        discount = Decimal(cents).scaleb(-2)
 
-        if self.max_discount_amount:
-            discount = min(discount, self.max_discount_amount)
+        if self.max_discount_amount and discount > self.max_discount_amount:
+            return self.max_discount_amount.quantize(_CENT)
 
-        return discount.quantize(Decimal('0.01'))
+        return discount
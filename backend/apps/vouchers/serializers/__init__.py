@@ -5,6 +5,7 @@ Voucher serializers package.
 from apps.vouchers.serializers.fixed_amount import FixedAmountVoucherSerializer
 from apps.vouchers.serializers.free_shipping import FreeShippingVoucherSerializer
 from apps.vouchers.serializers.percentage_discount import PercentageDiscountVoucherSerializer
+from apps.vouchers.serializers.polymorphic import PolymorphicVoucherSerializer
 from apps.vouchers.serializers.usage import (
     VoucherUsageSerializer,
     VoucherUsageCreateSerializer,
@@ -23,6 +24,7 @@ __all__ = [
     'PercentageDiscountVoucherSerializer',
     'FixedAmountVoucherSerializer',
     'FreeShippingVoucherSerializer',
+    'PolymorphicVoucherSerializer',
     'VoucherUsageSerializer',
     'VoucherUsageCreateSerializer',
     'VoucherValidateSerializer',
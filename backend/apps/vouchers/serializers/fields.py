@@ -0,0 +1,54 @@
+"""
+Custom serializer fields for vouchers.
+"""
+
+from rest_framework import serializers
+
+
+class UppercaseCharField(serializers.CharField):
+    """
+    CharField that canonicalizes its value to uppercase.
+
+    Voucher codes are stored uppercase; input that already is (the usual
+    case) is returned as-is instead of being copied by str.upper().
+    """
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        return value if value.isupper() else value.upper()
+
+
+# id(choices) -> (choices, grouped_choices, _choices, choice_strings_to_values)
+_CHOICE_MAPS = {}
+
+
+class CachedChoiceField(serializers.ChoiceField):
+    """
+    ChoiceField that builds its choice lookup maps once per declaration.
+
+    Serializer fields are deep-copied, and so re-initialized, for every
+    serializer instance. Choices given as a tuple survive the deep copy
+    as the same object, so the maps derived from them are built on first
+    use and shared afterwards. Other iterables fall back to DRF's
+    per-instance behaviour.
+    """
+
+    def _set_choices(self, choices):
+        if not isinstance(choices, tuple):
+            super()._set_choices(choices)
+            return
+
+        cached = _CHOICE_MAPS.get(id(choices))
+        if cached is not None and cached[0] is choices:
+            _, self.grouped_choices, self._choices, self.choice_strings_to_values = cached
+            return
+
+        super()._set_choices(choices)
+        _CHOICE_MAPS[id(choices)] = (
+            choices,
+            self.grouped_choices,
+            self._choices,
+            self.choice_strings_to_values,
+        )
+
+    choices = property(serializers.ChoiceField._get_choices, _set_choices)
@@ -9,6 +9,8 @@ from rest_framework import serializers
 from apps.vouchers.models import FixedAmountVoucher
 from apps.vouchers.serializers.voucher import VoucherSerializer
 
+_ZERO = Decimal('0')
+
 
 class FixedAmountVoucherSerializer(VoucherSerializer):
     """
@@ -17,16 +19,16 @@ class FixedAmountVoucherSerializer(VoucherSerializer):
 
     class Meta(VoucherSerializer.Meta):
         model = FixedAmountVoucher
-        fields = VoucherSerializer.Meta.fields + [
+        fields = VoucherSerializer.Meta.fields + (
             'discount_amount',
             'min_purchase_amount',
-        ]
+        )
 
     def validate_discount_amount(self, value):
         """
         Validate discount amount is positive.
         """
-        if value <= Decimal('0'):
+        if value <= _ZERO:
             raise serializers.ValidationError(
                 "Discount amount must be greater than 0."
             )
@@ -9,6 +9,8 @@ from rest_framework import serializers
 from apps.vouchers.models import FreeShippingVoucher
 from apps.vouchers.serializers.voucher import VoucherSerializer
 
+_ZERO = Decimal('0')
+
 
 class FreeShippingVoucherSerializer(VoucherSerializer):
     """
@@ -17,16 +19,16 @@ class FreeShippingVoucherSerializer(VoucherSerializer):
 
     class Meta(VoucherSerializer.Meta):
         model = FreeShippingVoucher
-        fields = VoucherSerializer.Meta.fields + [
+        fields = VoucherSerializer.Meta.fields + (
             'min_purchase_amount',
             'max_shipping_amount',
-        ]
+        )
 
     def validate_max_shipping_amount(self, value):
         """
         Validate max shipping amount if provided.
         """
-        if value is not None and value <= Decimal('0'):
+        if value is not None and value <= _ZERO:
             raise serializers.ValidationError(
                 "Maximum shipping amount must be greater than 0."
             )
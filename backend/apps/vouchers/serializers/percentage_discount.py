@@ -9,6 +9,9 @@ from rest_framework import serializers
 from apps.vouchers.models import PercentageDiscountVoucher
 from apps.vouchers.serializers.voucher import VoucherSerializer
 
+_ZERO = Decimal('0')
+_HUNDRED = Decimal('100')
+
 
 class PercentageDiscountVoucherSerializer(VoucherSerializer):
     """
@@ -17,17 +20,17 @@ class PercentageDiscountVoucherSerializer(VoucherSerializer):
 
     class Meta(VoucherSerializer.Meta):
         model = PercentageDiscountVoucher
-        fields = VoucherSerializer.Meta.fields + [
+        fields = VoucherSerializer.Meta.fields + (
             'discount_percentage',
             'max_discount_amount',
             'min_purchase_amount',
-        ]
+        )
 
     def validate_discount_percentage(self, value):
         """
         Validate discount percentage is within valid range.
         """
-        if value <= Decimal('0') or value > Decimal('100'):
+        if value <= _ZERO or value > _HUNDRED:
             raise serializers.ValidationError(
                 "Discount percentage must be between 0.01 and 100."
             )
@@ -37,7 +40,7 @@ class PercentageDiscountVoucherSerializer(VoucherSerializer):
         """
         Validate max discount amount if provided.
         """
-        if value is not None and value <= Decimal('0'):
+        if value is not None and value <= _ZERO:
             raise serializers.ValidationError(
                 "Maximum discount amount must be greater than 0."
             )
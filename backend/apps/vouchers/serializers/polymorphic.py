@@ -0,0 +1,60 @@
+"""
+Read-only serializer that renders any concrete voucher type.
+"""
+
+from apps.vouchers.serializers.fixed_amount import FixedAmountVoucherSerializer
+from apps.vouchers.serializers.free_shipping import FreeShippingVoucherSerializer
+from apps.vouchers.serializers.percentage_discount import PercentageDiscountVoucherSerializer
+from apps.vouchers.serializers.voucher import VoucherSerializer
+
+_CONCRETE_SERIALIZERS = (
+    PercentageDiscountVoucherSerializer,
+    FixedAmountVoucherSerializer,
+    FreeShippingVoucherSerializer,
+)
+
+# Concrete voucher class -> ((field name, serializer field), ...), built on
+# first use and published in one assignment.
+_EXTRA_FIELDS = None
+
+
+def _get_extra_fields(model):
+    """
+    Return the type-specific fields serialized for a concrete voucher class.
+
+    The fields are taken from the per-type serializers, so the output
+    matches theirs exactly. The map is built in full before it is stored,
+    so concurrent requests never see it half filled.
+    """
+    global _EXTRA_FIELDS
+    extra_fields = _EXTRA_FIELDS
+    if extra_fields is None:
+        base_fields = set(VoucherSerializer.Meta.fields)
+        extra_fields = {}
+        for serializer_class in _CONCRETE_SERIALIZERS:
+            fields = serializer_class().fields
+            extra_fields[serializer_class.Meta.model] = tuple(
+                (name, fields[name])
+                for name in serializer_class.Meta.fields
+                if name not in base_fields
+            )
+        _EXTRA_FIELDS = extra_fields
+
+    return extra_fields.get(model, ())
+
+
+class PolymorphicVoucherSerializer(VoucherSerializer):
+    """
+    Serialize vouchers of any type with their type-specific fields.
+
+    Renders the base voucher fields, then appends the fields of the
+    instance's concrete class. Produces the same output as the matching
+    per-type serializer, without choosing a serializer class per row.
+    """
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        for name, field in _get_extra_fields(type(instance)):
+            value = getattr(instance, name)
+            data[name] = None if value is None else field.to_representation(value)
+        return data
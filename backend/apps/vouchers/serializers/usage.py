@@ -4,24 +4,85 @@ Serializers for voucher usage tracking.
 
 from decimal import Decimal
 
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from apps.vouchers.enums import VoucherStatus
-from apps.vouchers.models import Voucher, VoucherUsage
+from apps.vouchers.models import Voucher, VoucherUsage, calculate
+from apps.vouchers.serializers.fields import UppercaseCharField
+
+_ZERO = Decimal('0')
+
+# status -> display label, built once instead of scanning choices per call
+_STATUS_LABEL = dict(VoucherStatus.choices)
+
+
+class BatchedVoucherUsageListSerializer(serializers.ListSerializer):
+    """
+    List serializer that resolves voucher and user display values once.
+
+    Builds {voucher_id: (code, name)} and {user_id: (email, full_name)}
+    maps per distinct related row, reusing relations that were already
+    joined and fetching the rest with one values_list() query each,
+    instead of traversing both foreign keys on every usage.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        usages = list(iterable)
+
+        self.vouchers_map = {}
+        self.users_map = {}
+        missing_vouchers = set()
+        missing_users = set()
+        for usage in usages:
+            if usage.voucher_id not in self.vouchers_map:
+                if VoucherUsage.voucher.is_cached(usage):
+                    voucher = usage.voucher
+                    self.vouchers_map[voucher.pk] = (voucher.code, voucher.name)
+                else:
+                    missing_vouchers.add(usage.voucher_id)
+            if usage.user_id not in self.users_map:
+                if VoucherUsage.user.is_cached(usage):
+                    user = usage.user
+                    self.users_map[user.pk] = (user.email, user.get_full_name())
+                else:
+                    missing_users.add(usage.user_id)
+
+        if missing_vouchers:
+            rows = Voucher.objects.non_polymorphic().filter(
+                pk__in=missing_vouchers
+            ).values_list('pk', 'code', 'name')
+            for pk, code, name in rows:
+                self.vouchers_map[pk] = (code, name)
+
+        if missing_users:
+            rows = get_user_model().objects.filter(
+                pk__in=missing_users
+            ).values_list('pk', 'email', 'first_name', 'last_name')
+            for pk, email, first_name, last_name in rows:
+                # Mirrors User.get_full_name()
+                full_name = f"{first_name} {last_name}".strip() or email
+                self.users_map[pk] = (email, full_name)
+
+        return [self.child.to_representation(usage) for usage in usages]
 
 
 class VoucherUsageSerializer(serializers.ModelSerializer):
     """
     Serializer for voucher usage tracking.
     """
-    voucher_code = serializers.CharField(source='voucher.code', read_only=True)
-    voucher_name = serializers.CharField(source='voucher.name', read_only=True)
-    user_email = serializers.CharField(source='user.email', read_only=True)
-    user_name = serializers.CharField(source='user.get_full_name', read_only=True)
+    voucher_code = serializers.SerializerMethodField()
+    voucher_name = serializers.SerializerMethodField()
+    user_email = serializers.SerializerMethodField()
+    user_name = serializers.SerializerMethodField()
 
     class Meta:
         model = VoucherUsage
-        fields = [
+        fields = (
             'id',
             'voucher',
             'voucher_code',
@@ -34,19 +95,73 @@ class VoucherUsageSerializer(serializers.ModelSerializer):
             'used_at',
             'created_at',
             'updated_at',
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id',
             'used_at',
             'created_at',
             'updated_at',
-        ]
+        )
+        list_serializer_class = BatchedVoucherUsageListSerializer
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Apply the joins needed to serialize usages without N+1 queries.
+        """
+        return queryset.select_related('voucher', 'user')
+
+    def _voucher_values(self, obj):
+        """
+        Return (code, name) for the usage's voucher, batched when listing.
+        """
+        vouchers_map = getattr(self.parent, 'vouchers_map', None)
+        if vouchers_map and obj.voucher_id in vouchers_map:
+            return vouchers_map[obj.voucher_id]
+        return obj.voucher.code, obj.voucher.name
+
+    def _user_values(self, obj):
+        """
+        Return (email, full_name) for the usage's user, batched when listing.
+        """
+        users_map = getattr(self.parent, 'users_map', None)
+        if users_map and obj.user_id in users_map:
+            return users_map[obj.user_id]
+        return obj.user.email, obj.user.get_full_name()
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_voucher_code(self, obj):
+        """
+        Return the code of the voucher used.
+        """
+        return self._voucher_values(obj)[0]
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_voucher_name(self, obj):
+        """
+        Return the name of the voucher used.
+        """
+        return self._voucher_values(obj)[1]
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_user_email(self, obj):
+        """
+        Return the email of the user.
+        """
+        return self._user_values(obj)[0]
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_user_name(self, obj):
+        """
+        Return the full name of the user.
+        """
+        return self._user_values(obj)[1]
 
     def validate_purchase_amount(self, value):
         """
         Validate purchase amount is positive.
         """
-        if value < Decimal('0'):
+        if value < _ZERO:
             raise serializers.ValidationError(
                 "Purchase amount must be greater than or equal to 0."
             )
@@ -56,7 +171,7 @@ class VoucherUsageSerializer(serializers.ModelSerializer):
         """
         Validate discount applied is positive.
         """
-        if value < Decimal('0'):
+        if value < _ZERO:
             raise serializers.ValidationError(
                 "Discount applied must be greater than or equal to 0."
             )
@@ -67,29 +182,29 @@ class VoucherUsageCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating voucher usage records.
     """
-    voucher_code = serializers.CharField(write_only=True)
+    voucher_code = UppercaseCharField(write_only=True)
 
     class Meta:
         model = VoucherUsage
-        fields = [
+        fields = (
             'voucher_code',
             'purchase_amount',
             'discount_applied',
-        ]
+        )
 
     def validate_voucher_code(self, value):
         """
         Validate voucher exists and is valid.
         """
         try:
-            voucher = Voucher.objects.get(code=value.upper())
+            voucher = Voucher.objects.select_related('polymorphic_ctype').get(code=value)
         except Voucher.DoesNotExist:
             raise serializers.ValidationError("Voucher with this code does not exist.")
 
         if not voucher.is_valid:
             if voucher.status != VoucherStatus.ACTIVE:
                 raise serializers.ValidationError(
-                    f"Voucher is not active. Current status: {voucher.get_status_display()}"
+                    f"Voucher is not active. Current status: {_STATUS_LABEL[voucher.status]}"
                 )
             elif voucher.is_expired:
                 raise serializers.ValidationError("Voucher has expired.")
@@ -98,24 +213,28 @@ class VoucherUsageCreateSerializer(serializers.ModelSerializer):
             else:
                 raise serializers.ValidationError("Voucher is not valid for use.")
 
+        # Keep the fetched voucher so create() doesn't query it again
+        self._voucher = voucher
+
         return value
 
     def create(self, validated_data):
         """
         Create voucher usage and increment voucher usage count.
         """
-        voucher_code = validated_data.pop('voucher_code')
-        voucher = Voucher.objects.get(code=voucher_code.upper())
+        validated_data.pop('voucher_code')
+        voucher = self._voucher
 
-        # Create usage record
-        usage = VoucherUsage.objects.create(
-            voucher=voucher,
-            user=self.context['request'].user,
-            **validated_data
-        )
+        with transaction.atomic():
+            # Create usage record
+            usage = VoucherUsage.objects.create(
+                voucher=voucher,
+                user=self.context['request'].user,
+                **validated_data
+            )
 
-        # Increment voucher usage count
-        voucher.increment_usage()
+            # Increment voucher usage count
+            voucher.increment_usage()
 
         return usage
 
@@ -124,36 +243,30 @@ class VoucherValidateSerializer(serializers.Serializer):
     """
     Serializer for validating voucher codes.
     """
-    code = serializers.CharField(required=True)
+    code = UppercaseCharField(required=True)
     purchase_amount = serializers.DecimalField(
         max_digits=10,
         decimal_places=2,
         required=False,
-        min_value=Decimal('0')
+        min_value=_ZERO
     )
     shipping_amount = serializers.DecimalField(
         max_digits=10,
         decimal_places=2,
         required=False,
-        min_value=Decimal('0')
+        min_value=_ZERO
     )
 
     def validate(self, attrs):
         """
         Validate voucher and calculate potential discount.
         """
-        from apps.vouchers.models import (
-            PercentageDiscountVoucher,
-            FixedAmountVoucher,
-            FreeShippingVoucher,
-        )
-
-        code = attrs.get('code', '').upper()
-        purchase_amount = attrs.get('purchase_amount', Decimal('0'))
-        shipping_amount = attrs.get('shipping_amount', Decimal('0'))
+        code = attrs['code']
+        purchase_amount = attrs.get('purchase_amount', _ZERO)
+        shipping_amount = attrs.get('shipping_amount', _ZERO)
 
         try:
-            voucher = Voucher.objects.get(code=code)
+            voucher = Voucher.objects.get_cached(code)
         except Voucher.DoesNotExist:
             raise serializers.ValidationError({
                 'code': 'Voucher with this code does not exist.'
@@ -163,7 +276,7 @@ class VoucherValidateSerializer(serializers.Serializer):
         if not voucher.is_valid:
             error_message = 'Voucher is not valid.'
             if voucher.status != VoucherStatus.ACTIVE:
-                error_message = f'Voucher is {voucher.get_status_display().lower()}.'
+                error_message = f'Voucher is {_STATUS_LABEL[voucher.status].lower()}.'
             elif voucher.is_expired:
                 error_message = 'Voucher has expired.'
             elif voucher.usage_limit and voucher.usage_count >= voucher.usage_limit:
@@ -172,16 +285,7 @@ class VoucherValidateSerializer(serializers.Serializer):
             raise serializers.ValidationError({'code': error_message})
 
         # Calculate discount based on voucher type
-        discount = Decimal('0')
-        if isinstance(voucher, PercentageDiscountVoucher):
-            if purchase_amount >= voucher.min_purchase_amount:
-                discount = voucher.calculate_discount(purchase_amount)
-        elif isinstance(voucher, FixedAmountVoucher):
-            if purchase_amount >= voucher.min_purchase_amount:
-                discount = voucher.calculate_discount(purchase_amount)
-        elif isinstance(voucher, FreeShippingVoucher):
-            if purchase_amount >= voucher.min_purchase_amount:
-                discount = voucher.calculate_discount(purchase_amount, shipping_amount)
+        discount = calculate(voucher, purchase_amount, shipping_amount)
 
         attrs['voucher'] = voucher
         attrs['calculated_discount'] = discount
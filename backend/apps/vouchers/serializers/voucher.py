@@ -2,9 +2,43 @@
 Base serializer for all voucher types.
 """
 
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 from rest_framework import serializers
 
-from apps.vouchers.models import Voucher
+from apps.vouchers.models import (
+    FixedAmountVoucher,
+    FreeShippingVoucher,
+    PercentageDiscountVoucher,
+    Voucher,
+)
+
+# polymorphic_ctype_id -> model name, filled on first use.
+_CTYPE_MODEL_CACHE = {}
+
+
+def _get_voucher_type(ctype_id):
+    """
+    Resolve a polymorphic content type id to its model name.
+
+    Reads the id column directly so the polymorphic_ctype foreign key is
+    never dereferenced per row.
+    """
+    if not _CTYPE_MODEL_CACHE:
+        ctypes = ContentType.objects.get_for_models(
+            PercentageDiscountVoucher, FixedAmountVoucher, FreeShippingVoucher, Voucher
+        )
+        for model, ctype in ctypes.items():
+            _CTYPE_MODEL_CACHE[ctype.id] = model._meta.model_name
+
+    try:
+        return _CTYPE_MODEL_CACHE[ctype_id]
+    except KeyError:
+        model_name = ContentType.objects.get_for_id(ctype_id).model
+        _CTYPE_MODEL_CACHE[ctype_id] = model_name
+        return model_name
 
 
 class VoucherSerializer(serializers.ModelSerializer):
@@ -24,7 +58,7 @@ class VoucherSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Voucher
-        fields = [
+        fields = (
             'id',
             'code',
             'name',
@@ -42,37 +76,67 @@ class VoucherSerializer(serializers.ModelSerializer):
             'voucher_type',
             'is_valid',
             'is_expired',
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id',
             'usage_count',
             'created_at',
             'updated_at',
             'is_valid',
             'is_expired',
-        ]
+        )
         extra_kwargs = {
             'created_by': {'required': False},
         }
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Apply the joins needed to serialize vouchers without N+1 queries.
+
+        is_valid and is_expired are computed in SQL for every row.
+        """
+        return queryset.with_related().with_validity()
+
+    def to_representation(self, instance):
+        """
+        Evaluate is_valid/is_expired once per row against a shared timestamp.
+
+        With many=True the child serializer is reused for every row, so the
+        whole list is checked against a single clock read.
+        """
+        if not hasattr(self, '_now'):
+            self._now = timezone.now()
+        instance.prime_validity(self._now)
+        return super().to_representation(instance)
+
     def get_voucher_type(self, obj):
         """
         Return the type of voucher (polymorphic type name).
         """
-        return obj.polymorphic_ctype.model
+        return _get_voucher_type(obj.polymorphic_ctype_id)
 
     def get_usage_percentage(self, obj):
         """
         Calculate usage percentage if usage_limit exists.
+
+        Computed in integer hundredths of a percent (rounded half up) and
+        returned as a two-place Decimal, avoiding float division.
         """
-        if obj.usage_limit:
-            return round((obj.usage_count / obj.usage_limit) * 100, 2)
+        usage_limit = obj.usage_limit
+        if usage_limit:
+            hundredths = (obj.usage_count * 10000 + usage_limit // 2) // usage_limit
+            return Decimal(hundredths).scaleb(-2)
         return None
 
     def validate(self, attrs):
         """
         Validate voucher dates and other business logic.
         """
+        # Dates already stored on the instance were validated when saved
+        if 'valid_from' not in attrs and 'valid_until' not in attrs:
+            return attrs
+
         valid_from = attrs.get('valid_from', getattr(self.instance, 'valid_from', None))
         valid_until = attrs.get('valid_until', getattr(self.instance, 'valid_until', None))
 
@@ -90,14 +154,18 @@ class VoucherSerializer(serializers.ModelSerializer):
         # Convert to uppercase for consistency
         value = value.upper()
 
-        # Check uniqueness during create
-        if not self.instance and Voucher.objects.filter(code=value).exists():
-            raise serializers.ValidationError("A voucher with this code already exists.")
+        # Keeping the current code on update cannot collide
+        if self.instance is not None and self.instance.code == value:
+            return value
 
-        # Check uniqueness during update
-        if self.instance and value != self.instance.code:
-            if Voucher.objects.filter(code=value).exists():
-                raise serializers.ValidationError("A voucher with this code already exists.")
+        # One indexed existence probe covers both create and update; no
+        # rows are returned, so skip the polymorphic machinery entirely
+        queryset = Voucher.objects.non_polymorphic().filter(code=value)
+        if self.instance:
+            queryset = queryset.exclude(pk=self.instance.pk)
+
+        if queryset.only('pk').exists():
+            raise serializers.ValidationError("A voucher with this code already exists.")
 
         return value
 
@@ -111,7 +179,7 @@ class VoucherListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Voucher
-        fields = [
+        fields = (
             'id',
             'code',
             'name',
@@ -122,11 +190,33 @@ class VoucherListSerializer(serializers.ModelSerializer):
             'usage_limit',
             'voucher_type',
             'is_valid',
-        ]
+        )
         read_only_fields = fields
+        # Columns backing the fields above, including those is_valid reads
+        db_fields = (
+            'id',
+            'code',
+            'name',
+            'status',
+            'valid_from',
+            'valid_until',
+            'usage_count',
+            'usage_limit',
+            'polymorphic_ctype',
+        )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Restrict the queryset to the columns the list representation reads.
+
+        Drops description, audit columns and any joins so each row is as
+        narrow as possible; is_valid is computed in SQL.
+        """
+        return queryset.select_related(None).only(*cls.Meta.db_fields).with_validity()
 
     def get_voucher_type(self, obj):
         """
         Return the type of voucher.
         """
-        return obj.polymorphic_ctype.model
+        return _get_voucher_type(obj.polymorphic_ctype_id)
@@ -2,15 +2,47 @@
 Unified serializer for creating vouchers with polymorphic type handling.
 """
 
+from datetime import timedelta
 from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Upper
 from django.utils import timezone
 from rest_framework import serializers
 
 from apps.vouchers.models import (
     FixedAmountVoucher,
     PercentageDiscountVoucher,
+    Voucher,
 )
 from apps.vouchers.enums import VoucherStatus, DiscountType
+from apps.vouchers.serializers.fields import CachedChoiceField, UppercaseCharField
+
+_ZERO = Decimal('0')
+_HUNDRED = Decimal('100')
+_ZERO_AMOUNT = Decimal('0.00')
+
+# Plain string values of the discount types accepted on create
+_FIXED = DiscountType.FIXED_AMOUNT.value
+_PERCENT = DiscountType.PERCENTAGE.value
+
+# Immutable so CachedChoiceField can share its lookup maps
+_DISCOUNT_TYPE_CHOICES = (
+    (_FIXED, 'Fixed Amount'),
+    (_PERCENT, 'Percentage'),
+)
+_STATUS_CHOICES = tuple(VoucherStatus.choices)
+
+# discount_type -> (voucher model, name of its discount amount field)
+_TYPE_DISPATCH = {
+    _FIXED: (FixedAmountVoucher, 'discount_amount'),
+    _PERCENT: (PercentageDiscountVoucher, 'discount_percentage'),
+}
+
+# Indefinite vouchers expire 100 years after their start
+_FAR_FUTURE_DELTA = timedelta(days=36500)
+
+_DUPLICATE_CODE = "A voucher with this code already exists."
 
 
 class VoucherCreateSerializer(serializers.Serializer):
@@ -20,7 +52,7 @@ class VoucherCreateSerializer(serializers.Serializer):
     Accepts a discount_type field to determine which polymorphic type to create.
     Supports optional validity dates for vouchers valid indefinitely.
     """
-    code = serializers.CharField(
+    code = UppercaseCharField(
         max_length=50,
         help_text='Unique voucher code'
     )
@@ -35,11 +67,8 @@ class VoucherCreateSerializer(serializers.Serializer):
         default='',
         help_text='Detailed description of the voucher'
     )
-    discount_type = serializers.ChoiceField(
-        choices=[
-            (DiscountType.FIXED_AMOUNT.value, 'Fixed Amount'),
-            (DiscountType.PERCENTAGE.value, 'Percentage'),
-        ],
+    discount_type = CachedChoiceField(
+        choices=_DISCOUNT_TYPE_CHOICES,
         help_text='Type of discount: fixed amount or percentage'
     )
     discount_amount = serializers.DecimalField(
@@ -67,28 +96,16 @@ class VoucherCreateSerializer(serializers.Serializer):
         default=False,
         help_text='Whether the voucher is valid indefinitely'
     )
-    status = serializers.ChoiceField(
-        choices=VoucherStatus.choices,
+    status = CachedChoiceField(
+        choices=_STATUS_CHOICES,
         default=VoucherStatus.ACTIVE,
         required=False,
         help_text='Initial status of the voucher'
     )
 
-    def validate_code(self, value):
-        """Validate voucher code uniqueness."""
-        value = value.upper()
-
-        # Check if code already exists
-        if FixedAmountVoucher.objects.filter(code=value).exists():
-            raise serializers.ValidationError("A voucher with this code already exists.")
-        if PercentageDiscountVoucher.objects.filter(code=value).exists():
-            raise serializers.ValidationError("A voucher with this code already exists.")
-
-        return value
-
     def validate_discount_amount(self, value):
         """Validate discount amount is positive."""
-        if value <= Decimal('0'):
+        if value <= _ZERO:
             raise serializers.ValidationError("Discount amount must be greater than 0.")
         return value
 
@@ -101,8 +118,8 @@ class VoucherCreateSerializer(serializers.Serializer):
         valid_until = attrs.get('valid_until')
 
         # Validate percentage discount is between 0-100
-        if discount_type == DiscountType.PERCENTAGE.value:
-            if discount_amount > Decimal('100'):
+        if discount_type == _PERCENT:
+            if discount_amount > _HUNDRED:
                 raise serializers.ValidationError({
                     'discount_amount': 'Percentage discount cannot exceed 100.'
                 })
@@ -127,11 +144,12 @@ class VoucherCreateSerializer(serializers.Serializer):
                 })
         else:
             # Set default dates for indefinite vouchers if not provided
+            now = timezone.now()
             if not valid_from:
-                attrs['valid_from'] = timezone.now()
+                attrs['valid_from'] = now
             if not valid_until:
                 # Set to a far future date (100 years from now)
-                attrs['valid_until'] = timezone.now() + timezone.timedelta(days=36500)
+                attrs['valid_until'] = now + _FAR_FUTURE_DELTA
 
         # Set default name to code if not provided
         if not attrs.get('name'):
@@ -151,18 +169,67 @@ class VoucherCreateSerializer(serializers.Serializer):
         # Map max_uses to usage_limit
         validated_data['usage_limit'] = max_uses
 
-        # Create the appropriate voucher type
-        if discount_type == DiscountType.FIXED_AMOUNT.value:
-            voucher = FixedAmountVoucher.objects.create(
-                **validated_data,
-                discount_amount=discount_amount,
-                min_purchase_amount=Decimal('0.00')
-            )
-        else:  # percentage
-            voucher = PercentageDiscountVoucher.objects.create(
-                **validated_data,
-                discount_percentage=discount_amount,
-                min_purchase_amount=Decimal('0.00')
-            )
+        # Create the appropriate voucher type; a duplicate code is
+        # rejected by the unique constraints in the same statement.
+        model, amount_field = _TYPE_DISPATCH[discount_type]
+        validated_data[amount_field] = discount_amount
+        try:
+            with transaction.atomic():
+                voucher = model.objects.create(
+                    **validated_data,
+                    min_purchase_amount=_ZERO_AMOUNT
+                )
+        except IntegrityError as exc:
+            # Only a real code collision is reported as a field error
+            code = validated_data['code']
+            if not Voucher.objects.non_polymorphic().filter(code__iexact=code).exists():
+                raise
+            raise serializers.ValidationError({'code': [_DUPLICATE_CODE]}) from exc
 
         return voucher
+
+    @classmethod
+    def create_many(cls, validated_list):
+        """
+        Create a batch of vouchers, skipping codes that already exist.
+
+        Existing codes are found with a single case-insensitive query up
+        front instead of one lookup per voucher, matching the UPPER(code)
+        unique constraint. Each insert runs in its own savepoint inside the
+        batch transaction, so a row the database rejects, such as a code
+        taken concurrently after that query, is skipped without rolling
+        back the rest. Codes repeated within the batch are created once.
+
+        Args:
+            validated_list: validated_data dicts, one per voucher
+
+        Returns:
+            Tuple of (created vouchers, skipped codes)
+        """
+        codes = {attrs['code'].upper() for attrs in validated_list}
+        seen = set(
+            Voucher.objects.non_polymorphic()
+            .annotate(code_upper=Upper('code'))
+            .filter(code_upper__in=codes)
+            .values_list('code_upper', flat=True)
+        )
+
+        serializer = cls()
+        created = []
+        skipped = []
+        with transaction.atomic():
+            for attrs in validated_list:
+                code = attrs['code']
+                if code.upper() in seen:
+                    skipped.append(code)
+                    continue
+                seen.add(code.upper())
+                try:
+                    # A failed insert only rolls back its own savepoint;
+                    # create() reports a code collision as a ValidationError
+                    with transaction.atomic():
+                        created.append(serializer.create(dict(attrs)))
+                except (IntegrityError, serializers.ValidationError):
+                    skipped.append(code)
+
+        return created, skipped
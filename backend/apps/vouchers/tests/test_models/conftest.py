@@ -0,0 +1,62 @@
+"""
+Shared fixtures for voucher model tests.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.vouchers.models import Voucher
+from apps.vouchers.factories import PercentageDiscountVoucherFactory, VoucherUsageFactory
+from apps.users.factories import UserFactory
+
+_ONE_DAY = timedelta(days=1)
+_TWO_DAYS = timedelta(days=2)
+
+
+@pytest.fixture
+def time_windows():
+    """
+    Fixture for timestamps around a single now() snapshot.
+
+    Keys: now, two_days_ago, yesterday, tomorrow, in_two_days.
+    """
+    now = timezone.now()
+    return {
+        'now': now,
+        'two_days_ago': now - _TWO_DAYS,
+        'yesterday': now - _ONE_DAY,
+        'tomorrow': now + _ONE_DAY,
+        'in_two_days': now + _TWO_DAYS,
+    }
+
+
+@pytest.fixture(scope='module')
+def usage_bundle(django_db_setup, django_db_blocker):
+    """
+    Fixture for usage rows shared by the read-only tests of a module.
+
+    The rows are created once, outside the per-test transaction, and
+    deleted again when the module finishes. Tests using it must not
+    modify them.
+
+    Keys: voucher (code TEST123), user (test@example.com), usages (3 rows,
+    oldest first).
+    """
+    with django_db_blocker.unblock():
+        user = UserFactory(email='test@example.com')
+
+    try:
+        with django_db_blocker.unblock():
+            # The user also creates the voucher, so no SubFactory creator
+            # is committed alongside it
+            voucher = PercentageDiscountVoucherFactory(code='TEST123', created_by=user)
+            usages = VoucherUsageFactory.create_batch(3, voucher=voucher, user=user)
+
+        yield {'voucher': voucher, 'user': user, 'usages': usages}
+    finally:
+        with django_db_blocker.unblock():
+            # Deleting the user's vouchers and the user cascades to the usages
+            Voucher.objects.filter(created_by=user).delete()
+            user.delete()
@@ -6,10 +6,12 @@ from decimal import Decimal
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError
 from django.utils import timezone
 
 from apps.vouchers.enums import VoucherStatus
 from apps.vouchers.factories import PercentageDiscountVoucherFactory
+from apps.vouchers.models import PercentageDiscountVoucher, Voucher
 from apps.users.factories import UserFactory
 
 
@@ -32,7 +34,7 @@ class TestVoucherModel:
     def test_voucher_string_representation(self):
         """Test Voucher __str__ method."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             code='TEST123',
             name='Test Voucher'
         )
@@ -51,10 +53,6 @@ class TestVoucherModel:
 
         # Act & Assert
         # Factory uses get_or_create, so create directly to test constraint
-        from django.db import IntegrityError
-        from apps.vouchers.models import PercentageDiscountVoucher
-        from django.utils import timezone
-
         with pytest.raises(IntegrityError):
             PercentageDiscountVoucher.objects.create(
                 code=code,
@@ -66,14 +64,30 @@ class TestVoucherModel:
                 created_by=voucher1.created_by
             )
 
-    def test_is_valid_property_active_voucher(self):
+    def test_voucher_code_uniqueness_is_case_insensitive(self):
+        """Test voucher codes differing only in case are rejected."""
+        # Arrange
+        voucher1 = PercentageDiscountVoucherFactory(code='CASED123')
+
+        # Act & Assert
+        with pytest.raises(IntegrityError):
+            PercentageDiscountVoucher.objects.create(
+                code='cased123',
+                name='Test',
+                status=VoucherStatus.ACTIVE,
+                valid_from=timezone.now(),
+                valid_until=timezone.now() + timezone.timedelta(days=30),
+                discount_percentage=Decimal('10.00'),
+                created_by=voucher1.created_by
+            )
+
+    def test_is_valid_property_active_voucher(self, time_windows):
         """Test is_valid property for active voucher within valid dates."""
         # Arrange
-        now = timezone.now()
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             status=VoucherStatus.ACTIVE,
-            valid_from=now - timezone.timedelta(days=1),
-            valid_until=now + timezone.timedelta(days=1),
+            valid_from=time_windows['yesterday'],
+            valid_until=time_windows['tomorrow'],
             usage_limit=10,
             usage_count=5
         )
@@ -81,53 +95,49 @@ class TestVoucherModel:
         # Act & Assert
         assert voucher.is_valid is True
 
-    def test_is_valid_property_inactive_voucher(self):
+    def test_is_valid_property_inactive_voucher(self, time_windows):
         """Test is_valid property for inactive voucher."""
         # Arrange
-        now = timezone.now()
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             status=VoucherStatus.EXPIRED,
-            valid_from=now - timezone.timedelta(days=1),
-            valid_until=now + timezone.timedelta(days=1)
+            valid_from=time_windows['yesterday'],
+            valid_until=time_windows['tomorrow']
         )
 
         # Act & Assert
         assert voucher.is_valid is False
 
-    def test_is_valid_property_before_valid_from(self):
+    def test_is_valid_property_before_valid_from(self, time_windows):
         """Test is_valid property for voucher before valid_from date."""
         # Arrange
-        now = timezone.now()
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             status=VoucherStatus.ACTIVE,
-            valid_from=now + timezone.timedelta(days=1),
-            valid_until=now + timezone.timedelta(days=2)
+            valid_from=time_windows['tomorrow'],
+            valid_until=time_windows['in_two_days']
         )
 
         # Act & Assert
         assert voucher.is_valid is False
 
-    def test_is_valid_property_after_valid_until(self):
+    def test_is_valid_property_after_valid_until(self, time_windows):
         """Test is_valid property for voucher after valid_until date."""
         # Arrange
-        now = timezone.now()
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             status=VoucherStatus.ACTIVE,
-            valid_from=now - timezone.timedelta(days=2),
-            valid_until=now - timezone.timedelta(days=1)
+            valid_from=time_windows['two_days_ago'],
+            valid_until=time_windows['yesterday']
         )
 
         # Act & Assert
         assert voucher.is_valid is False
 
-    def test_is_valid_property_usage_limit_reached(self):
+    def test_is_valid_property_usage_limit_reached(self, time_windows):
         """Test is_valid property when usage limit is reached."""
         # Arrange
-        now = timezone.now()
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             status=VoucherStatus.ACTIVE,
-            valid_from=now - timezone.timedelta(days=1),
-            valid_until=now + timezone.timedelta(days=1),
+            valid_from=time_windows['yesterday'],
+            valid_until=time_windows['tomorrow'],
             usage_limit=10,
             usage_count=10
         )
@@ -135,14 +145,13 @@ class TestVoucherModel:
         # Act & Assert
         assert voucher.is_valid is False
 
-    def test_is_valid_property_unlimited_usage(self):
+    def test_is_valid_property_unlimited_usage(self, time_windows):
         """Test is_valid property with unlimited usage."""
         # Arrange
-        now = timezone.now()
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             status=VoucherStatus.ACTIVE,
-            valid_from=now - timezone.timedelta(days=1),
-            valid_until=now + timezone.timedelta(days=1),
+            valid_from=time_windows['yesterday'],
+            valid_until=time_windows['tomorrow'],
             usage_limit=None,
             usage_count=1000
         )
@@ -150,17 +159,16 @@ class TestVoucherModel:
         # Act & Assert
         assert voucher.is_valid is True
 
-    def test_is_expired_property(self):
+    def test_is_expired_property(self, time_windows):
         """Test is_expired property."""
         # Arrange
-        now = timezone.now()
-        expired_voucher = PercentageDiscountVoucherFactory(
-            valid_from=now - timezone.timedelta(days=2),
-            valid_until=now - timezone.timedelta(days=1)
+        expired_voucher = PercentageDiscountVoucherFactory.build(
+            valid_from=time_windows['two_days_ago'],
+            valid_until=time_windows['yesterday']
         )
-        valid_voucher = PercentageDiscountVoucherFactory(
-            valid_from=now - timezone.timedelta(days=1),
-            valid_until=now + timezone.timedelta(days=1)
+        valid_voucher = PercentageDiscountVoucherFactory.build(
+            valid_from=time_windows['yesterday'],
+            valid_until=time_windows['tomorrow']
         )
 
         # Act & Assert
@@ -199,6 +207,21 @@ class TestVoucherModel:
         assert voucher.usage_count == 10
         assert voucher.status == VoucherStatus.USED
 
+    def test_increment_usage_invalidates_cached_is_valid(self):
+        """Test increment_usage drops the memoized is_valid value."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory(
+            usage_limit=1,
+            usage_count=0
+        )
+        assert voucher.is_valid is True
+
+        # Act
+        voucher.increment_usage()
+
+        # Assert
+        assert voucher.is_valid is False
+
     def test_clean_validation_invalid_dates(self):
         """Test clean() validation fails when valid_until <= valid_from."""
         # Arrange
@@ -220,17 +243,13 @@ class TestVoucherModel:
         voucher3 = PercentageDiscountVoucherFactory()
 
         # Act
-        from apps.vouchers.models import Voucher
-        vouchers = Voucher.objects.all()
+        pks = list(Voucher.objects.values_list('pk', flat=True))
 
         # Assert
-        assert list(vouchers) == [voucher3, voucher2, voucher1]
+        assert pks == [voucher3.pk, voucher2.pk, voucher1.pk]
 
     def test_voucher_meta_db_table(self):
         """Test Voucher model uses correct database table."""
-        # Arrange
-        from apps.vouchers.models import Voucher
-
         # Act & Assert
         assert Voucher._meta.db_table == 'vouchers'
 
@@ -255,6 +274,5 @@ class TestVoucherModel:
         user.delete()
 
         # Assert
-        from apps.vouchers.models import Voucher
-        voucher = Voucher.objects.get(id=voucher_id)
+        voucher = Voucher.objects.with_related().get(id=voucher_id)
         assert voucher.created_by is None
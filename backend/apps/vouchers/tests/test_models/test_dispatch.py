@@ -0,0 +1,67 @@
+"""
+Tests for voucher discount dispatch.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from apps.vouchers.factories import (
+    FixedAmountVoucherFactory,
+    FreeShippingVoucherFactory,
+    PercentageDiscountVoucherFactory,
+)
+from apps.vouchers.models import Voucher, calculate
+
+
+@pytest.mark.django_db
+class TestCalculate:
+    """Test suite for the calculate() dispatcher."""
+
+    def test_calculate_percentage_voucher(self):
+        """Test calculate() dispatches to the percentage routine."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory(discount_percentage=Decimal('10.00'))
+
+        # Act & Assert
+        assert calculate(voucher, Decimal('100.00')) == Decimal('10.00')
+
+    def test_calculate_fixed_amount_voucher(self):
+        """Test calculate() dispatches to the fixed amount routine."""
+        # Arrange
+        voucher = FixedAmountVoucherFactory(discount_amount=Decimal('25.00'))
+
+        # Act & Assert
+        assert calculate(voucher, Decimal('100.00')) == Decimal('25.00')
+
+    def test_calculate_free_shipping_voucher(self):
+        """Test calculate() passes the shipping amount through."""
+        # Arrange
+        voucher = FreeShippingVoucherFactory(max_shipping_amount=None)
+
+        # Act & Assert
+        assert calculate(voucher, Decimal('100.00'), Decimal('12.00')) == Decimal('12.00')
+        assert calculate(voucher, Decimal('100.00')) == Decimal('0')
+
+    def test_calculate_below_minimum_purchase_returns_bare_zero(self):
+        """Test calculate() returns 0, not 0.00, below the minimum purchase."""
+        # Arrange
+        voucher = FixedAmountVoucherFactory(
+            discount_amount=Decimal('5.00'),
+            min_purchase_amount=Decimal('50.00'),
+        )
+
+        # Act
+        discount = calculate(voucher, Decimal('10.00'))
+
+        # Assert
+        assert str(discount) == '0'
+
+    def test_calculate_polymorphic_base_query(self):
+        """Test calculate() works on instances loaded through the base manager."""
+        # Arrange
+        voucher = FixedAmountVoucherFactory(discount_amount=Decimal('5.00'))
+        base_voucher = Voucher.objects.get(pk=voucher.pk)
+
+        # Act & Assert
+        assert calculate(base_voucher, Decimal('50.00')) == Decimal('5.00')
@@ -7,6 +7,7 @@ from decimal import Decimal
 import pytest
 
 from apps.vouchers.factories import FixedAmountVoucherFactory
+from apps.vouchers.models import FixedAmountVoucher, Voucher
 
 
 @pytest.mark.django_db
@@ -26,7 +27,7 @@ class TestFixedAmountVoucher:
     def test_calculate_discount_basic(self):
         """Test basic discount calculation."""
         # Arrange
-        voucher = FixedAmountVoucherFactory(
+        voucher = FixedAmountVoucherFactory.build(
             discount_amount=Decimal('10.00'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -40,7 +41,7 @@ class TestFixedAmountVoucher:
     def test_calculate_discount_below_minimum(self):
         """Test discount is 0 when purchase is below minimum."""
         # Arrange
-        voucher = FixedAmountVoucherFactory(
+        voucher = FixedAmountVoucherFactory.build(
             discount_amount=Decimal('15.00'),
             min_purchase_amount=Decimal('50.00')
         )
@@ -54,7 +55,7 @@ class TestFixedAmountVoucher:
     def test_calculate_discount_capped_at_purchase_amount(self):
         """Test discount cannot exceed purchase amount."""
         # Arrange
-        voucher = FixedAmountVoucherFactory(
+        voucher = FixedAmountVoucherFactory.build(
             discount_amount=Decimal('50.00'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -69,7 +70,7 @@ class TestFixedAmountVoucher:
     def test_calculate_discount_exact_purchase_amount(self):
         """Test discount when it equals purchase amount."""
         # Arrange
-        voucher = FixedAmountVoucherFactory(
+        voucher = FixedAmountVoucherFactory.build(
             discount_amount=Decimal('100.00'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -83,7 +84,7 @@ class TestFixedAmountVoucher:
     def test_calculate_discount_with_minimum_requirement(self):
         """Test discount with minimum purchase requirement."""
         # Arrange
-        voucher = FixedAmountVoucherFactory(
+        voucher = FixedAmountVoucherFactory.build(
             discount_amount=Decimal('20.00'),
             min_purchase_amount=Decimal('100.00')
         )
@@ -101,7 +102,7 @@ class TestFixedAmountVoucher:
     def test_calculate_discount_small_amounts(self):
         """Test discount with small amounts."""
         # Arrange
-        voucher = FixedAmountVoucherFactory(
+        voucher = FixedAmountVoucherFactory.build(
             discount_amount=Decimal('5.00'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -115,7 +116,7 @@ class TestFixedAmountVoucher:
     def test_calculate_discount_large_amounts(self):
         """Test discount with large amounts."""
         # Arrange
-        voucher = FixedAmountVoucherFactory(
+        voucher = FixedAmountVoucherFactory.build(
             discount_amount=Decimal('100.00'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -132,8 +133,7 @@ class TestFixedAmountVoucher:
         voucher = FixedAmountVoucherFactory()
 
         # Act
-        from apps.vouchers.models import Voucher, FixedAmountVoucher
-        base_voucher = Voucher.objects.get(id=voucher.id)
+        base_voucher = Voucher.objects.with_related().get(id=voucher.id)
 
         # Assert
         assert isinstance(base_voucher, FixedAmountVoucher)
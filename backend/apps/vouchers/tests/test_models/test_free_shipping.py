@@ -7,6 +7,7 @@ from decimal import Decimal
 import pytest
 
 from apps.vouchers.factories import FreeShippingVoucherFactory
+from apps.vouchers.models import FreeShippingVoucher, Voucher
 
 
 @pytest.mark.django_db
@@ -24,7 +25,7 @@ class TestFreeShippingVoucher:
     def test_calculate_discount_basic(self):
         """Test basic shipping discount calculation."""
         # Arrange
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('0.00'),
             max_shipping_amount=None
         )
@@ -41,7 +42,7 @@ class TestFreeShippingVoucher:
     def test_calculate_discount_below_minimum(self):
         """Test discount is 0 when purchase is below minimum."""
         # Arrange
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('50.00'),
             max_shipping_amount=None
         )
@@ -58,7 +59,7 @@ class TestFreeShippingVoucher:
     def test_calculate_discount_with_max_cap(self):
         """Test discount is capped at max_shipping_amount."""
         # Arrange
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('0.00'),
             max_shipping_amount=Decimal('10.00')
         )
@@ -76,7 +77,7 @@ class TestFreeShippingVoucher:
     def test_calculate_discount_without_max_cap(self):
         """Test discount without max cap covers full shipping."""
         # Arrange
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('0.00'),
             max_shipping_amount=None
         )
@@ -93,7 +94,7 @@ class TestFreeShippingVoucher:
     def test_calculate_discount_exact_minimum(self):
         """Test discount when purchase equals minimum."""
         # Arrange
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('100.00'),
             max_shipping_amount=None
         )
@@ -110,7 +111,7 @@ class TestFreeShippingVoucher:
     def test_calculate_discount_shipping_below_cap(self):
         """Test discount when shipping is below max cap."""
         # Arrange
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('0.00'),
             max_shipping_amount=Decimal('20.00')
         )
@@ -128,7 +129,7 @@ class TestFreeShippingVoucher:
     def test_calculate_discount_zero_shipping(self):
         """Test discount with zero shipping cost."""
         # Arrange
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('0.00'),
             max_shipping_amount=None
         )
@@ -145,7 +146,7 @@ class TestFreeShippingVoucher:
     def test_calculate_discount_high_minimum_requirement(self):
         """Test discount with high minimum purchase requirement."""
         # Arrange
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('200.00'),
             max_shipping_amount=None
         )
@@ -170,7 +171,6 @@ class TestFreeShippingVoucher:
         voucher = FreeShippingVoucherFactory()
 
         # Act
-        from apps.vouchers.models import Voucher, FreeShippingVoucher
         base_voucher = Voucher.objects.get(id=voucher.id)
 
         # Assert
@@ -0,0 +1,155 @@
+"""
+Tests for Voucher managers.
+"""
+
+import pytest
+from django.utils import timezone
+
+from apps.vouchers.enums import VoucherStatus
+from apps.vouchers.factories import (
+    FixedAmountVoucherFactory,
+    PercentageDiscountVoucherFactory,
+)
+from apps.vouchers.models import PercentageDiscountVoucher, Voucher
+
+
+@pytest.mark.django_db
+class TestVoucherManager:
+    """Test suite for VoucherManager."""
+
+    def test_with_validity_matches_model_properties(self):
+        """Test with_validity() annotations agree with is_valid/is_expired."""
+        # Arrange
+        now = timezone.now()
+        valid = PercentageDiscountVoucherFactory(
+            status=VoucherStatus.ACTIVE,
+            valid_from=now - timezone.timedelta(days=1),
+            valid_until=now + timezone.timedelta(days=1),
+            usage_limit=10,
+            usage_count=5,
+        )
+        exhausted = FixedAmountVoucherFactory(
+            status=VoucherStatus.ACTIVE,
+            valid_from=now - timezone.timedelta(days=1),
+            valid_until=now + timezone.timedelta(days=1),
+            usage_limit=5,
+            usage_count=5,
+        )
+        expired = PercentageDiscountVoucherFactory(
+            status=VoucherStatus.ACTIVE,
+            valid_from=now - timezone.timedelta(days=2),
+            valid_until=now - timezone.timedelta(days=1),
+            usage_limit=None,
+        )
+
+        # Act
+        results = {v.pk: v for v in Voucher.objects.with_validity(now)}
+
+        # Assert
+        assert results[valid.pk].__dict__['is_valid'] is True
+        assert results[valid.pk].__dict__['is_expired'] is False
+        assert results[exhausted.pk].__dict__['is_valid'] is False
+        assert results[expired.pk].__dict__['is_valid'] is False
+        assert results[expired.pk].__dict__['is_expired'] is True
+
+    def test_save_drops_annotated_validity(self):
+        """Test save() discards annotated flags so they are recomputed."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory(status=VoucherStatus.ACTIVE)
+        annotated = Voucher.objects.with_validity().get(pk=voucher.pk)
+        assert annotated.is_valid is True
+
+        # Act
+        annotated.status = VoucherStatus.CANCELLED
+        annotated.save()
+
+        # Assert
+        assert annotated.is_valid is False
+
+    def test_bulk_increment_updates_usage_counts(self):
+        """Test bulk_increment() adds the given count to each voucher."""
+        # Arrange
+        voucher1 = PercentageDiscountVoucherFactory(usage_count=1)
+        voucher2 = FixedAmountVoucherFactory(usage_count=0)
+
+        # Act
+        updated = Voucher.objects.bulk_increment(
+            [voucher1.pk, voucher2.pk],
+            [5, 3]
+        )
+
+        # Assert
+        assert updated == 2
+        voucher1.refresh_from_db()
+        voucher2.refresh_from_db()
+        assert voucher1.usage_count == 6
+        assert voucher2.usage_count == 3
+        assert voucher1.status == VoucherStatus.ACTIVE
+
+    def test_bulk_increment_marks_used_when_limit_reached(self):
+        """Test bulk_increment() marks vouchers as used at their usage limit."""
+        # Arrange
+        limited = PercentageDiscountVoucherFactory(usage_limit=5, usage_count=3)
+        unlimited = PercentageDiscountVoucherFactory(usage_limit=None, usage_count=3)
+
+        # Act
+        Voucher.objects.bulk_increment([limited.pk, unlimited.pk], [2, 2])
+
+        # Assert
+        limited.refresh_from_db()
+        unlimited.refresh_from_db()
+        assert limited.usage_count == 5
+        assert limited.status == VoucherStatus.USED
+        assert unlimited.usage_count == 5
+        assert unlimited.status == VoucherStatus.ACTIVE
+
+    def test_get_cached_serves_repeat_lookups_from_cache(self, django_assert_num_queries):
+        """Test a cache hit only re-reads status and usage_count."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory(code='CACHED')
+        Voucher.objects.get_cached('CACHED')
+
+        # Act & Assert
+        with django_assert_num_queries(1):
+            cached = Voucher.objects.get_cached('CACHED')
+        assert isinstance(cached, PercentageDiscountVoucher)
+        assert cached.pk == voucher.pk
+
+    def test_get_cached_sees_writes_that_bypass_save(self):
+        """Test status and usage_count changed by update() are not served stale."""
+        # Arrange
+        PercentageDiscountVoucherFactory(
+            code='BYPASS',
+            status=VoucherStatus.ACTIVE,
+            usage_count=0,
+            usage_limit=1,
+        )
+        assert Voucher.objects.get_cached('BYPASS').is_valid
+
+        # Act
+        Voucher.objects.filter(code='BYPASS').update(usage_count=1)
+        exhausted = Voucher.objects.get_cached('BYPASS')
+        Voucher.objects.filter(code='BYPASS').update(status=VoucherStatus.CANCELLED)
+        deactivated = Voucher.objects.get_cached('BYPASS')
+
+        # Assert
+        assert exhausted.usage_count == 1
+        assert not exhausted.is_valid
+        assert deactivated.status == VoucherStatus.CANCELLED
+
+    def test_get_cached_is_invalidated_by_increment_usage(self):
+        """Test increment_usage() evicts the cached voucher."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory(code='EVICT', usage_count=0)
+        Voucher.objects.get_cached('EVICT')
+
+        # Act
+        voucher.increment_usage()
+
+        # Assert
+        assert Voucher.objects.get_cached('EVICT').usage_count == 1
+
+    def test_bulk_increment_with_no_vouchers(self):
+        """Test bulk_increment() is a no-op for empty input."""
+        # Act & Assert
+        assert Voucher.objects.bulk_increment([], []) == 0
@@ -7,6 +7,7 @@ from decimal import Decimal
 import pytest
 
 from apps.vouchers.factories import PercentageDiscountVoucherFactory
+from apps.vouchers.models import PercentageDiscountVoucher, Voucher
 
 
 @pytest.mark.django_db
@@ -26,7 +27,7 @@ class TestPercentageDiscountVoucher:
     def test_calculate_discount_basic(self):
         """Test basic discount calculation."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('10.00'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -40,7 +41,7 @@ class TestPercentageDiscountVoucher:
     def test_calculate_discount_below_minimum(self):
         """Test discount is 0 when purchase is below minimum."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('20.00'),
             min_purchase_amount=Decimal('50.00')
         )
@@ -54,7 +55,7 @@ class TestPercentageDiscountVoucher:
     def test_calculate_discount_with_max_cap(self):
         """Test discount is capped at max_discount_amount."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('50.00'),
             max_discount_amount=Decimal('20.00'),
             min_purchase_amount=Decimal('0.00')
@@ -70,7 +71,7 @@ class TestPercentageDiscountVoucher:
     def test_calculate_discount_without_max_cap(self):
         """Test discount without max cap."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('25.00'),
             max_discount_amount=None,
             min_purchase_amount=Decimal('0.00')
@@ -85,7 +86,7 @@ class TestPercentageDiscountVoucher:
     def test_calculate_discount_exact_minimum(self):
         """Test discount when purchase equals minimum."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('15.00'),
             min_purchase_amount=Decimal('100.00')
         )
@@ -99,7 +100,7 @@ class TestPercentageDiscountVoucher:
     def test_calculate_discount_high_percentage(self):
         """Test discount with high percentage."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('100.00'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -113,7 +114,7 @@ class TestPercentageDiscountVoucher:
     def test_calculate_discount_small_amount(self):
         """Test discount calculation with small amounts."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('10.00'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -127,7 +128,7 @@ class TestPercentageDiscountVoucher:
     def test_calculate_discount_precision(self):
         """Test discount calculation maintains precision."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('7.50'),
             min_purchase_amount=Decimal('0.00')
         )
@@ -145,7 +146,6 @@ class TestPercentageDiscountVoucher:
         voucher = PercentageDiscountVoucherFactory()
 
         # Act
-        from apps.vouchers.models import Voucher, PercentageDiscountVoucher
         base_voucher = Voucher.objects.get(id=voucher.id)
 
         # Assert
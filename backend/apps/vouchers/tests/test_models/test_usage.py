@@ -10,6 +10,7 @@ from apps.vouchers.factories import (
     VoucherUsageFactory,
     PercentageDiscountVoucherFactory
 )
+from apps.vouchers.models import VoucherUsage
 from apps.users.factories import UserFactory
 
 
@@ -29,15 +30,10 @@ class TestVoucherUsage:
         assert usage.purchase_amount > 0
         assert usage.discount_applied >= 0
 
-    def test_voucher_usage_string_representation(self):
+    def test_voucher_usage_string_representation(self, usage_bundle):
         """Test VoucherUsage __str__ method."""
         # Arrange
-        user = UserFactory(email='test@example.com')
-        voucher = PercentageDiscountVoucherFactory(code='TEST123')
-        usage = VoucherUsageFactory(
-            user=user,
-            voucher=voucher
-        )
+        usage = usage_bundle['usages'][0]
 
         # Act
         result = str(usage)
@@ -73,38 +69,36 @@ class TestVoucherUsage:
         assert usage.purchase_amount == Decimal('150.00')
         assert usage.discount_applied == Decimal('15.00')
 
-    def test_voucher_usage_default_ordering(self):
+    def test_voucher_usage_default_ordering(self, usage_bundle):
         """Test voucher usages are ordered by used_at descending."""
         # Arrange
-        usage1 = VoucherUsageFactory()
-        usage2 = VoucherUsageFactory()
-        usage3 = VoucherUsageFactory()
+        usage1, usage2, usage3 = usage_bundle['usages']
 
         # Act
-        from apps.vouchers.models import VoucherUsage
-        usages = VoucherUsage.objects.all()
+        pks = list(
+            VoucherUsage.objects.filter(voucher=usage_bundle['voucher']).values_list('pk', flat=True)
+        )
 
         # Assert
-        assert list(usages) == [usage3, usage2, usage1]
+        assert pks == [usage3.pk, usage2.pk, usage1.pk]
 
     def test_voucher_usage_meta_db_table(self):
         """Test VoucherUsage model uses correct database table."""
-        # Arrange
-        from apps.vouchers.models import VoucherUsage
-
         # Act & Assert
         assert VoucherUsage._meta.db_table == 'voucher_usages'
 
     def test_multiple_usages_for_same_voucher(self):
         """Test multiple users can use the same voucher."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory()
         user1 = UserFactory()
         user2 = UserFactory()
+        voucher = PercentageDiscountVoucherFactory(created_by=user1)
 
         # Act
-        usage1 = VoucherUsageFactory(voucher=voucher, user=user1)
-        usage2 = VoucherUsageFactory(voucher=voucher, user=user2)
+        usage1, usage2 = VoucherUsage.objects.bulk_create([
+            VoucherUsageFactory.build(voucher=voucher, user=user1),
+            VoucherUsageFactory.build(voucher=voucher, user=user2),
+        ])
 
         # Assert
         assert voucher.usages.count() == 2
@@ -115,12 +109,14 @@ class TestVoucherUsage:
         """Test same user can use multiple vouchers."""
         # Arrange
         user = UserFactory()
-        voucher1 = PercentageDiscountVoucherFactory()
-        voucher2 = PercentageDiscountVoucherFactory()
+        voucher1 = PercentageDiscountVoucherFactory(created_by=user)
+        voucher2 = PercentageDiscountVoucherFactory(created_by=user)
 
         # Act
-        usage1 = VoucherUsageFactory(voucher=voucher1, user=user)
-        usage2 = VoucherUsageFactory(voucher=voucher2, user=user)
+        usage1, usage2 = VoucherUsage.objects.bulk_create([
+            VoucherUsageFactory.build(voucher=voucher1, user=user),
+            VoucherUsageFactory.build(voucher=voucher2, user=user),
+        ])
 
         # Assert
         assert user.voucher_usages.count() == 2
@@ -138,7 +134,6 @@ class TestVoucherUsage:
         voucher.delete()
 
         # Assert
-        from apps.vouchers.models import VoucherUsage
         assert not VoucherUsage.objects.filter(id=usage_id).exists()
 
     def test_voucher_usage_cascade_delete_on_user(self):
@@ -152,13 +147,12 @@ class TestVoucherUsage:
         user.delete()
 
         # Assert
-        from apps.vouchers.models import VoucherUsage
         assert not VoucherUsage.objects.filter(id=usage_id).exists()
 
-    def test_voucher_usage_used_at_auto_timestamp(self):
+    def test_voucher_usage_used_at_auto_timestamp(self, usage_bundle):
         """Test used_at is automatically set on creation."""
         # Arrange & Act
-        usage = VoucherUsageFactory()
+        usage = usage_bundle['usages'][0]
 
         # Assert
         assert usage.used_at is not None
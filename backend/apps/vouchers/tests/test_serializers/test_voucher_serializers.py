@@ -7,6 +7,7 @@ from decimal import Decimal
 import pytest
 from django.utils import timezone
 
+from apps.vouchers.models import Voucher
 from apps.vouchers.serializers import VoucherSerializer, VoucherListSerializer
 from apps.vouchers.factories import (
     PercentageDiscountVoucherFactory,
@@ -21,10 +22,15 @@ from apps.users.factories import UserFactory
 class TestVoucherSerializer:
     """Test suite for VoucherSerializer."""
 
-    def test_serialize_percentage_voucher(self):
-        """Test serializing a percentage discount voucher."""
+    @pytest.mark.parametrize('factory,expected_type', [
+        (PercentageDiscountVoucherFactory, 'percentagediscountvoucher'),
+        (FixedAmountVoucherFactory, 'fixedamountvoucher'),
+        (FreeShippingVoucherFactory, 'freeshippingvoucher'),
+    ])
+    def test_serialize_voucher(self, factory, expected_type):
+        """Test serializing each voucher type through the base serializer."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory()
+        voucher = factory()
 
         # Act
         serializer = VoucherSerializer(voucher)
@@ -35,34 +41,10 @@ class TestVoucherSerializer:
         assert data['code'] == voucher.code
         assert data['name'] == voucher.name
         assert data['status'] == voucher.status
-        assert data['voucher_type'] == 'percentagediscountvoucher'
+        assert data['voucher_type'] == expected_type
         assert 'is_valid' in data
         assert 'is_expired' in data
 
-    def test_serialize_fixed_amount_voucher(self):
-        """Test serializing a fixed amount voucher."""
-        # Arrange
-        voucher = FixedAmountVoucherFactory()
-
-        # Act
-        serializer = VoucherSerializer(voucher)
-        data = serializer.data
-
-        # Assert
-        assert data['voucher_type'] == 'fixedamountvoucher'
-
-    def test_serialize_free_shipping_voucher(self):
-        """Test serializing a free shipping voucher."""
-        # Arrange
-        voucher = FreeShippingVoucherFactory()
-
-        # Act
-        serializer = VoucherSerializer(voucher)
-        data = serializer.data
-
-        # Assert
-        assert data['voucher_type'] == 'freeshippingvoucher'
-
     def test_created_by_name_field(self):
         """Test created_by_name field shows creator's full name."""
         # Arrange
@@ -103,6 +85,20 @@ class TestVoucherSerializer:
         # Assert
         assert serializer.data['usage_percentage'] is None
 
+    def test_usage_percentage_rounding(self):
+        """Test usage_percentage is rounded to two decimal places."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory(
+            usage_limit=3,
+            usage_count=2
+        )
+
+        # Act
+        serializer = VoucherSerializer(voucher)
+
+        # Assert
+        assert serializer.data['usage_percentage'] == Decimal('66.67')
+
     def test_validate_code_uppercase_conversion(self):
         """Test voucher code is converted to uppercase."""
         # Arrange
@@ -144,6 +140,16 @@ class TestVoucherSerializer:
         assert not serializer.is_valid()
         assert 'code' in serializer.errors
 
+    def test_validate_code_unchanged_on_update_skips_query(self, django_assert_num_queries):
+        """Test re-submitting the current code on update runs no query."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory(code='KEEPME')
+        serializer = VoucherSerializer(instance=voucher, partial=True)
+
+        # Act & Assert
+        with django_assert_num_queries(0):
+            assert serializer.validate_code('keepme') == 'KEEPME'
+
     def test_validate_dates(self):
         """Test validation fails when valid_until <= valid_from."""
         # Arrange
@@ -180,9 +186,10 @@ class TestVoucherSerializer:
 
         # Assert
         assert serializer.is_valid()
-        serializer.save()
-        voucher.refresh_from_db()
-        assert voucher.usage_count == original_count
+        # update() assigns every validated field to the instance it returns
+        updated = serializer.save()
+        assert 'usage_count' not in serializer.validated_data
+        assert updated.usage_count == original_count
 
 
 @pytest.mark.django_db
@@ -237,6 +244,157 @@ class TestVoucherListSerializer:
         assert fixed_data['voucher_type'] == 'fixedamountvoucher'
         assert free_shipping_data['voucher_type'] == 'freeshippingvoucher'
 
+    def test_setup_eager_loading_only_loads_list_columns(self):
+        """Test setup_eager_loading() defers columns the list does not show."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory()
+
+        # Act
+        queryset = VoucherListSerializer.setup_eager_loading(Voucher.objects.all())
+        result = queryset.get(pk=voucher.pk)
+        data = VoucherListSerializer(result).data
+
+        # Assert
+        deferred = result.get_deferred_fields()
+        assert 'description' in deferred
+        assert 'created_by_id' in deferred
+        assert data['code'] == voucher.code
+        assert data['voucher_type'] == 'percentagediscountvoucher'
+        assert data['is_valid'] == voucher.is_valid
+
+
+@pytest.mark.django_db
+class TestVoucherCreateSerializer:
+    """Test suite for VoucherCreateSerializer."""
+
+    def test_code_is_uppercased_on_input(self):
+        """Test the code field canonicalizes input to uppercase."""
+        # Arrange
+        from apps.vouchers.serializers import VoucherCreateSerializer
+        serializer = VoucherCreateSerializer(data={
+            'code': 'Summer10',
+            'discount_type': 'PERCENTAGE',
+            'discount_amount': '10.00',
+        })
+
+        # Act
+        is_valid = serializer.is_valid()
+
+        # Assert
+        assert is_valid, serializer.errors
+        assert serializer.validated_data['code'] == 'SUMMER10'
+
+    def test_choice_maps_shared_between_instances(self):
+        """Test choice fields reuse their lookup maps across instances."""
+        # Arrange
+        from apps.vouchers.serializers import VoucherCreateSerializer
+
+        # Act
+        first = VoucherCreateSerializer().fields['discount_type']
+        second = VoucherCreateSerializer().fields['discount_type']
+
+        # Assert
+        assert first is not second
+        assert first.choice_strings_to_values is second.choice_strings_to_values
+        assert set(first.choices) == {'FIXED_AMOUNT', 'PERCENTAGE'}
+
+    def test_save_rejects_code_of_any_voucher_type(self):
+        """Test duplicate codes are rejected even for free shipping vouchers."""
+        # Arrange
+        from rest_framework.exceptions import ValidationError as DRFValidationError
+        from apps.vouchers.serializers import VoucherCreateSerializer
+        FreeShippingVoucherFactory(code='SHIPFREE')
+        serializer = VoucherCreateSerializer(data={
+            'code': 'shipfree',
+            'discount_type': 'FIXED_AMOUNT',
+            'discount_amount': '10.00',
+        })
+        assert serializer.is_valid(), serializer.errors
+
+        # Act & Assert
+        with pytest.raises(DRFValidationError) as exc_info:
+            serializer.save(created_by=UserFactory())
+        assert 'code' in exc_info.value.detail
+
+    def test_save_reports_duplicate_code_as_field_error_list(self):
+        """Test a duplicate code is reported in DRF's field-error list shape."""
+        # Arrange
+        from rest_framework.exceptions import ValidationError as DRFValidationError
+        from apps.vouchers.serializers import VoucherCreateSerializer
+        PercentageDiscountVoucherFactory(code='TAKEN10')
+        serializer = VoucherCreateSerializer(data={
+            'code': 'TAKEN10',
+            'discount_type': 'PERCENTAGE',
+            'discount_amount': '10.00',
+        })
+        assert serializer.is_valid(), serializer.errors
+
+        # Act
+        with pytest.raises(DRFValidationError) as exc_info:
+            serializer.save(created_by=UserFactory())
+
+        # Assert
+        assert exc_info.value.detail == {
+            'code': ['A voucher with this code already exists.']
+        }
+
+    def test_create_many_skips_existing_and_repeated_codes(self):
+        """Test create_many() creates new codes once and skips taken ones."""
+        # Arrange
+        from apps.vouchers.models import FixedAmountVoucher, PercentageDiscountVoucher
+        from apps.vouchers.serializers import VoucherCreateSerializer
+        PercentageDiscountVoucherFactory(code='TAKEN')
+        now = timezone.now()
+        base = {
+            'description': '',
+            'status': VoucherStatus.ACTIVE,
+            'valid_from': now,
+            'valid_until': now + timezone.timedelta(days=30),
+        }
+        validated_list = [
+            {**base, 'code': 'BULKFIX', 'name': 'BULKFIX',
+             'discount_type': 'FIXED_AMOUNT', 'discount_amount': Decimal('5.00')},
+            {**base, 'code': 'BULKPCT', 'name': 'BULKPCT',
+             'discount_type': 'PERCENTAGE', 'discount_amount': Decimal('15.00')},
+            {**base, 'code': 'TAKEN', 'name': 'TAKEN',
+             'discount_type': 'FIXED_AMOUNT', 'discount_amount': Decimal('5.00')},
+            {**base, 'code': 'BULKFIX', 'name': 'BULKFIX',
+             'discount_type': 'FIXED_AMOUNT', 'discount_amount': Decimal('5.00')},
+        ]
+
+        # Act
+        created, skipped = VoucherCreateSerializer.create_many(validated_list)
+
+        # Assert
+        assert [v.code for v in created] == ['BULKFIX', 'BULKPCT']
+        assert isinstance(created[0], FixedAmountVoucher)
+        assert isinstance(created[1], PercentageDiscountVoucher)
+        assert skipped == ['TAKEN', 'BULKFIX']
+
+    def test_create_many_skips_codes_stored_in_another_case(self):
+        """Test create_many() treats a stored lowercase code as taken."""
+        # Arrange
+        from apps.vouchers.serializers import VoucherCreateSerializer
+        PercentageDiscountVoucherFactory(code='lower10')
+        now = timezone.now()
+        validated_list = [
+            {'code': 'LOWER10', 'name': 'LOWER10', 'description': '',
+             'status': VoucherStatus.ACTIVE, 'valid_from': now,
+             'valid_until': now + timezone.timedelta(days=30),
+             'discount_type': 'PERCENTAGE', 'discount_amount': Decimal('10.00')},
+            {'code': 'FRESH10', 'name': 'FRESH10', 'description': '',
+             'status': VoucherStatus.ACTIVE, 'valid_from': now,
+             'valid_until': now + timezone.timedelta(days=30),
+             'discount_type': 'PERCENTAGE', 'discount_amount': Decimal('10.00')},
+        ]
+
+        # Act
+        created, skipped = VoucherCreateSerializer.create_many(validated_list)
+
+        # Assert
+        assert [v.code for v in created] == ['FRESH10']
+        assert skipped == ['LOWER10']
+
 
 @pytest.mark.django_db
 class TestPercentageDiscountVoucherSerializer:
@@ -246,7 +404,7 @@ class TestPercentageDiscountVoucherSerializer:
         """Test serializing percentage voucher includes specific fields."""
         # Arrange
         from apps.vouchers.serializers import PercentageDiscountVoucherSerializer
-        voucher = PercentageDiscountVoucherFactory(
+        voucher = PercentageDiscountVoucherFactory.build(
             discount_percentage=Decimal('15.00'),
             max_discount_amount=Decimal('50.00'),
             min_purchase_amount=Decimal('100.00')
@@ -270,7 +428,7 @@ class TestFixedAmountVoucherSerializer:
         """Test serializing fixed amount voucher includes specific fields."""
         # Arrange
         from apps.vouchers.serializers import FixedAmountVoucherSerializer
-        voucher = FixedAmountVoucherFactory(
+        voucher = FixedAmountVoucherFactory.build(
             discount_amount=Decimal('25.00'),
             min_purchase_amount=Decimal('100.00')
         )
@@ -292,7 +450,7 @@ class TestFreeShippingVoucherSerializer:
         """Test serializing free shipping voucher includes specific fields."""
         # Arrange
         from apps.vouchers.serializers import FreeShippingVoucherSerializer
-        voucher = FreeShippingVoucherFactory(
+        voucher = FreeShippingVoucherFactory.build(
             min_purchase_amount=Decimal('50.00'),
             max_shipping_amount=Decimal('15.00')
         )
@@ -306,6 +464,46 @@ class TestFreeShippingVoucherSerializer:
         assert str(data['max_shipping_amount']) == '15.00'
 
 
+@pytest.mark.django_db
+class TestPolymorphicVoucherSerializer:
+    """Test suite for PolymorphicVoucherSerializer."""
+
+    def test_matches_type_specific_serializers(self):
+        """Test output equals the per-type serializer for each voucher type."""
+        # Arrange
+        from apps.vouchers.serializers import (
+            FixedAmountVoucherSerializer,
+            FreeShippingVoucherSerializer,
+            PercentageDiscountVoucherSerializer,
+            PolymorphicVoucherSerializer,
+        )
+        vouchers = [
+            (PercentageDiscountVoucherFactory(max_discount_amount=None), PercentageDiscountVoucherSerializer),
+            (FixedAmountVoucherFactory(), FixedAmountVoucherSerializer),
+            (FreeShippingVoucherFactory(), FreeShippingVoucherSerializer),
+        ]
+
+        # Act & Assert
+        for voucher, serializer_class in vouchers:
+            assert PolymorphicVoucherSerializer(voucher).data == serializer_class(voucher).data
+
+    def test_serialize_mixed_type_list(self):
+        """Test many=True renders each voucher with its own fields."""
+        # Arrange
+        from apps.vouchers.serializers import PolymorphicVoucherSerializer
+        percentage = PercentageDiscountVoucherFactory()
+        fixed = FixedAmountVoucherFactory()
+
+        # Act
+        data = PolymorphicVoucherSerializer([percentage, fixed], many=True).data
+
+        # Assert
+        assert 'discount_percentage' in data[0]
+        assert 'discount_amount' not in data[0]
+        assert 'discount_amount' in data[1]
+        assert 'discount_percentage' not in data[1]
+
+
 @pytest.mark.django_db
 class TestVoucherUsageSerializer:
     """Test suite for VoucherUsageSerializer."""
@@ -331,3 +529,23 @@ class TestVoucherUsageSerializer:
         assert 'voucher' in data
         assert 'user' in data
         assert 'used_at' in data
+
+    def test_serialize_usage_list_batches_related_lookups(self, django_assert_num_queries):
+        """Test many=True resolves vouchers and users with one query each."""
+        # Arrange
+        from apps.vouchers.models import VoucherUsage
+        from apps.vouchers.serializers import VoucherUsageSerializer
+        from apps.vouchers.factories import VoucherUsageFactory
+        user = UserFactory(first_name='Jane', last_name='Doe')
+        voucher = PercentageDiscountVoucherFactory(code='BATCHED')
+        VoucherUsageFactory.create_batch(3, voucher=voucher, user=user)
+
+        # Act
+        with django_assert_num_queries(3):
+            data = VoucherUsageSerializer(VoucherUsage.objects.all(), many=True).data
+
+        # Assert
+        assert len(data) == 3
+        assert all(row['voucher_code'] == 'BATCHED' for row in data)
+        assert all(row['user_name'] == 'Jane Doe' for row in data)
+        assert all(row['user_email'] == user.email for row in data)
@@ -0,0 +1,54 @@
+"""
+Shared fixtures for voucher view tests.
+"""
+
+import pytest
+
+from apps.vouchers.enums import VoucherStatus
+from apps.vouchers.models import Voucher
+from apps.vouchers.factories import (
+    PercentageDiscountVoucherFactory,
+    FixedAmountVoucherFactory,
+    FreeShippingVoucherFactory,
+)
+from apps.users.factories import UserFactory
+
+
+@pytest.fixture
+def voucher_mix(db):
+    """
+    Fixture for one voucher of each concrete type.
+
+    Keys: percentage, fixed, free_shipping.
+    """
+    return {
+        'percentage': PercentageDiscountVoucherFactory(),
+        'fixed': FixedAmountVoucherFactory(),
+        'free_shipping': FreeShippingVoucherFactory(),
+    }
+
+
+@pytest.fixture(scope='class')
+def shared_active_voucher(django_db_setup, django_db_blocker):
+    """
+    Fixture for an active voucher shared by the read-only tests of a class.
+
+    The voucher is created once, outside the per-test transaction, and
+    deleted along with its creator when the class finishes. Tests using
+    it must not modify it.
+    """
+    with django_db_blocker.unblock():
+        creator = UserFactory()
+
+    try:
+        with django_db_blocker.unblock():
+            voucher = PercentageDiscountVoucherFactory(
+                status=VoucherStatus.ACTIVE,
+                created_by=creator,
+            )
+
+        yield voucher
+    finally:
+        with django_db_blocker.unblock():
+            Voucher.objects.filter(created_by=creator).delete()
+            creator.delete()
@@ -3,20 +3,46 @@ Tests for VoucherViewSet.
 """
 
 from decimal import Decimal
+from functools import lru_cache
 
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
+from rest_framework.test import APIClient
 
 from apps.vouchers.enums import VoucherStatus
 from apps.vouchers.factories import (
     PercentageDiscountVoucherFactory,
     FixedAmountVoucherFactory,
-    FreeShippingVoucherFactory,
+    VoucherUsageFactory,
 )
+from apps.vouchers.models import Voucher
+from apps.vouchers.models.managers import voucher_list_cache_key
 from apps.users.factories import UserFactory, AdminUserFactory, ManagerUserFactory
 
+# Validity window for vouchers created through the API, fixed at import
+_NOW = timezone.now()
+VALID_FROM_ISO = _NOW.isoformat()
+VALID_UNTIL_ISO = (_NOW + timezone.timedelta(days=30)).isoformat()
+
+
+@lru_cache(maxsize=None)
+def list_url():
+    """
+    Return the voucher list URL, resolved once per test session.
+    """
+    return reverse('voucher-list')
+
+
+@lru_cache(maxsize=None)
+def detail_url(pk):
+    """
+    Return the voucher detail URL for a primary key, resolved once per pk.
+    """
+    return reverse('voucher-detail', kwargs={'pk': pk})
+
 
 @pytest.mark.django_db
 class TestVoucherViewSetList:
@@ -27,7 +53,7 @@ class TestVoucherViewSetList:
         # Arrange
         PercentageDiscountVoucherFactory.create_batch(2)
         FixedAmountVoucherFactory.create_batch(2)
-        url = reverse('voucher-list')
+        url = list_url()
 
         # Act
         response = admin_client.get(url)
@@ -36,13 +62,114 @@ class TestVoucherViewSetList:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) >= 4
 
+    def test_list_vouchers_query_count_is_constant(self, admin_client, django_assert_max_num_queries):
+        """Test listing a full page does not query per voucher or creator."""
+        # Arrange
+        for _ in range(10):
+            PercentageDiscountVoucherFactory(created_by=UserFactory())
+            FixedAmountVoucherFactory(created_by=UserFactory())
+        url = list_url()
+        admin_client.get(url)  # Warm the content type cache
+        cache.clear()  # ...but not the cached page
+
+        # Act
+        # COUNT, the base rows, then one query per concrete voucher type
+        with django_assert_max_num_queries(4):
+            response = admin_client.get(url)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 20
+        assert all(v['created_by_name'] for v in response.data['results'])
+
+    def test_list_served_from_cache(self, admin_client, django_assert_num_queries):
+        """Test a repeated list request is answered from the cache."""
+        # Arrange
+        PercentageDiscountVoucherFactory.create_batch(2)
+        url = list_url()
+        first = admin_client.get(url)
+
+        # Act
+        with django_assert_num_queries(0):
+            response = admin_client.get(url)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == first.data
+
+    def test_list_cache_invalidated_by_voucher_write(self, admin_client):
+        """Test saving a voucher drops cached list pages."""
+        # Arrange
+        url = list_url()
+        admin_client.get(url)
+
+        # Act
+        PercentageDiscountVoucherFactory(code='FRESH')
+        response = admin_client.get(url)
+
+        # Assert
+        assert 'FRESH' in {v['code'] for v in response.data['results']}
+
+    def test_list_cache_invalidated_by_creator_rename(self, admin_client):
+        """Test renaming a voucher's creator drops cached list pages."""
+        # Arrange
+        creator = UserFactory(first_name='Old', last_name='Name')
+        PercentageDiscountVoucherFactory(code='RENAMED', created_by=creator)
+        url = list_url()
+        admin_client.get(url)
+
+        # Act
+        creator.first_name = 'New'
+        creator.save()
+        response = admin_client.get(url)
+
+        # Assert
+        names = {v['code']: v['created_by_name'] for v in response.data['results']}
+        assert names['RENAMED'] == 'New Name'
+
+    def test_list_not_cached_past_validity_boundary(self, admin_client):
+        """Test a page is not cached beyond a voucher's next validity boundary."""
+        # Arrange
+        PercentageDiscountVoucherFactory(
+            valid_from=timezone.now() + timezone.timedelta(milliseconds=500),
+        )
+
+        # Act
+        response = admin_client.get(list_url())
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        page_uri = response.wsgi_request.build_absolute_uri()
+        assert cache.get(voucher_list_cache_key('all', page_uri)) is None
+
+    def test_list_cache_is_scoped_by_visibility(self, admin_user, user):
+        """Test a page cached for an admin is not served to a regular user."""
+        # Arrange
+        PercentageDiscountVoucherFactory(status=VoucherStatus.EXPIRED)
+        admin = APIClient()
+        admin.force_authenticate(user=admin_user)
+        regular = APIClient()
+        regular.force_authenticate(user=user)
+        url = list_url()
+        admin.get(url)
+
+        # Act
+        response = regular.get(url)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert all(
+            voucher['status'] == VoucherStatus.ACTIVE
+            for voucher in response.data['results']
+        )
+
     def test_list_vouchers_as_manager(self, api_client):
         """Test manager can list all vouchers."""
         # Arrange
         manager = ManagerUserFactory()
         api_client.force_authenticate(user=manager)
         PercentageDiscountVoucherFactory.create_batch(3)
-        url = reverse('voucher-list')
+        url = list_url()
 
         # Act
         response = api_client.get(url)
@@ -56,7 +183,7 @@ class TestVoucherViewSetList:
         # Arrange
         PercentageDiscountVoucherFactory.create_batch(2, status=VoucherStatus.ACTIVE)
         PercentageDiscountVoucherFactory.create_batch(2, status=VoucherStatus.EXPIRED)
-        url = reverse('voucher-list')
+        url = list_url()
 
         # Act
         response = authenticated_client.get(url)
@@ -64,13 +191,15 @@ class TestVoucherViewSetList:
         # Assert
         assert response.status_code == status.HTTP_200_OK
         # Should only see active vouchers
-        for result in response.data['results']:
-            assert result['status'] == VoucherStatus.ACTIVE
+        assert all(
+            voucher['status'] == VoucherStatus.ACTIVE
+            for voucher in response.data['results']
+        )
 
     def test_list_vouchers_unauthenticated(self, api_client):
         """Test unauthenticated users cannot list vouchers."""
         # Arrange
-        url = reverse('voucher-list')
+        url = list_url()
 
         # Act
         response = api_client.get(url)
@@ -83,11 +212,11 @@ class TestVoucherViewSetList:
 class TestVoucherViewSetRetrieve:
     """Test suite for VoucherViewSet retrieve action."""
 
-    def test_retrieve_voucher_as_admin(self, admin_client):
+    def test_retrieve_voucher_as_admin(self, admin_client, shared_active_voucher):
         """Test admin can retrieve any voucher."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory()
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        voucher = shared_active_voucher
+        url = detail_url(voucher.id)
 
         # Act
         response = admin_client.get(url)
@@ -96,11 +225,11 @@ class TestVoucherViewSetRetrieve:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['code'] == voucher.code
 
-    def test_retrieve_active_voucher_as_user(self, authenticated_client):
+    def test_retrieve_active_voucher_as_user(self, authenticated_client, shared_active_voucher):
         """Test user can retrieve active voucher."""
         # Arrange
-        voucher = PercentageDiscountVoucherFactory(status=VoucherStatus.ACTIVE)
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        voucher = shared_active_voucher
+        url = detail_url(voucher.id)
 
         # Act
         response = authenticated_client.get(url)
@@ -109,11 +238,24 @@ class TestVoucherViewSetRetrieve:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['code'] == voucher.code
 
+    def test_retrieve_not_modified_since_last_fetch(self, admin_client, shared_active_voucher):
+        """Test a conditional retrieve is answered with 304."""
+        # Arrange
+        url = detail_url(shared_active_voucher.id)
+        first = admin_client.get(url)
+
+        # Act
+        response = admin_client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+
+        # Assert
+        assert first.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
     def test_retrieve_expired_voucher_as_user_fails(self, authenticated_client):
         """Test user cannot retrieve expired voucher."""
         # Arrange
         voucher = PercentageDiscountVoucherFactory(status=VoucherStatus.EXPIRED)
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        url = detail_url(voucher.id)
 
         # Act
         response = authenticated_client.get(url)
@@ -129,14 +271,14 @@ class TestVoucherViewSetCreate:
     def test_create_percentage_voucher_as_admin(self, admin_client, admin_user):
         """Test admin can create percentage voucher."""
         # Arrange
-        url = reverse('voucher-list')
+        url = list_url()
         data = {
             'voucher_type': 'percentagediscountvoucher',
             'code': 'NEWVOUCHER',
             'name': 'New Voucher',
             'status': VoucherStatus.ACTIVE,
-            'valid_from': timezone.now().isoformat(),
-            'valid_until': (timezone.now() + timezone.timedelta(days=30)).isoformat(),
+            'valid_from': VALID_FROM_ISO,
+            'valid_until': VALID_UNTIL_ISO,
             'discount_percentage': '15.00',
             'min_purchase_amount': '0.00',
         }
@@ -153,14 +295,14 @@ class TestVoucherViewSetCreate:
         # Arrange
         manager = ManagerUserFactory()
         api_client.force_authenticate(user=manager)
-        url = reverse('voucher-list')
+        url = list_url()
         data = {
             'voucher_type': 'fixedamountvoucher',
             'code': 'FIXED50',
             'name': 'Fixed $50 Off',
             'status': VoucherStatus.ACTIVE,
-            'valid_from': timezone.now().isoformat(),
-            'valid_until': (timezone.now() + timezone.timedelta(days=30)).isoformat(),
+            'valid_from': VALID_FROM_ISO,
+            'valid_until': VALID_UNTIL_ISO,
             'discount_amount': '50.00',
             'min_purchase_amount': '100.00',
         }
@@ -175,14 +317,14 @@ class TestVoucherViewSetCreate:
     def test_create_voucher_as_regular_user_fails(self, authenticated_client):
         """Test regular user cannot create vouchers."""
         # Arrange
-        url = reverse('voucher-list')
+        url = list_url()
         data = {
             'voucher_type': 'percentagediscountvoucher',
             'code': 'TESTCODE',
             'name': 'Test',
             'status': VoucherStatus.ACTIVE,
-            'valid_from': timezone.now().isoformat(),
-            'valid_until': (timezone.now() + timezone.timedelta(days=30)).isoformat(),
+            'valid_from': VALID_FROM_ISO,
+            'valid_until': VALID_UNTIL_ISO,
             'discount_percentage': '10.00',
         }
 
@@ -201,7 +343,7 @@ class TestVoucherViewSetUpdate:
         """Test admin can update vouchers."""
         # Arrange
         voucher = PercentageDiscountVoucherFactory()
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        url = detail_url(voucher.id)
         data = {
             'name': 'Updated Name',
             'description': 'Updated description',
@@ -220,7 +362,7 @@ class TestVoucherViewSetUpdate:
         manager = ManagerUserFactory()
         api_client.force_authenticate(user=manager)
         voucher = PercentageDiscountVoucherFactory()
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        url = detail_url(voucher.id)
         data = {'name': 'Manager Updated'}
 
         # Act
@@ -234,7 +376,7 @@ class TestVoucherViewSetUpdate:
         """Test regular user cannot update vouchers."""
         # Arrange
         voucher = PercentageDiscountVoucherFactory()
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        url = detail_url(voucher.id)
         data = {'name': 'Hacked'}
 
         # Act
@@ -252,14 +394,13 @@ class TestVoucherViewSetDelete:
         """Test admin can delete vouchers."""
         # Arrange
         voucher = PercentageDiscountVoucherFactory()
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        url = detail_url(voucher.id)
 
         # Act
         response = admin_client.delete(url)
 
         # Assert
         assert response.status_code == status.HTTP_204_NO_CONTENT
-        from apps.vouchers.models import Voucher
         assert not Voucher.objects.filter(id=voucher.id).exists()
 
     def test_delete_voucher_as_manager_fails(self, api_client):
@@ -268,7 +409,7 @@ class TestVoucherViewSetDelete:
         manager = ManagerUserFactory()
         api_client.force_authenticate(user=manager)
         voucher = PercentageDiscountVoucherFactory()
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        url = detail_url(voucher.id)
 
         # Act
         response = api_client.delete(url)
@@ -280,7 +421,7 @@ class TestVoucherViewSetDelete:
         """Test regular user cannot delete vouchers."""
         # Arrange
         voucher = PercentageDiscountVoucherFactory()
-        url = reverse('voucher-detail', kwargs={'pk': voucher.id})
+        url = detail_url(voucher.id)
 
         # Act
         response = authenticated_client.delete(url)
@@ -298,7 +439,7 @@ class TestVoucherViewSetFiltering:
         # Arrange
         PercentageDiscountVoucherFactory.create_batch(2, status=VoucherStatus.ACTIVE)
         PercentageDiscountVoucherFactory.create_batch(2, status=VoucherStatus.EXPIRED)
-        url = reverse('voucher-list')
+        url = list_url()
 
         # Act
         response = admin_client.get(url, {'status': VoucherStatus.EXPIRED})
@@ -315,7 +456,7 @@ class TestVoucherViewSetFiltering:
         # Arrange
         PercentageDiscountVoucherFactory(code='SEARCHME')
         PercentageDiscountVoucherFactory(code='OTHER123')
-        url = reverse('voucher-list')
+        url = list_url()
 
         # Act
         response = admin_client.get(url, {'search': 'SEARCHME'})
@@ -334,7 +475,7 @@ class TestVoucherViewSetFiltering:
         voucher1 = PercentageDiscountVoucherFactory()
         voucher2 = PercentageDiscountVoucherFactory()
         voucher3 = PercentageDiscountVoucherFactory()
-        url = reverse('voucher-list')
+        url = list_url()
 
         # Act
         response = admin_client.get(url, {'ordering': 'created_at'})
@@ -350,23 +491,12 @@ class TestVoucherViewSetFiltering:
 class TestVoucherViewSetPolymorphism:
     """Test suite for polymorphic voucher handling."""
 
-    def test_retrieve_returns_correct_voucher_type(self, admin_client):
+    def test_retrieve_returns_correct_voucher_type(self, admin_client, voucher_mix):
         """Test retrieve returns correct polymorphic type."""
-        # Arrange
-        percentage = PercentageDiscountVoucherFactory()
-        fixed = FixedAmountVoucherFactory()
-        free_shipping = FreeShippingVoucherFactory()
-
         # Act
-        percentage_response = admin_client.get(
-            reverse('voucher-detail', kwargs={'pk': percentage.id})
-        )
-        fixed_response = admin_client.get(
-            reverse('voucher-detail', kwargs={'pk': fixed.id})
-        )
-        free_shipping_response = admin_client.get(
-            reverse('voucher-detail', kwargs={'pk': free_shipping.id})
-        )
+        percentage_response = admin_client.get(detail_url(voucher_mix['percentage'].id))
+        fixed_response = admin_client.get(detail_url(voucher_mix['fixed'].id))
+        free_shipping_response = admin_client.get(detail_url(voucher_mix['free_shipping'].id))
 
         # Assert
         assert percentage_response.status_code == status.HTTP_200_OK
@@ -380,16 +510,10 @@ class TestVoucherViewSetPolymorphism:
         assert free_shipping_response.status_code == status.HTTP_200_OK
         assert free_shipping_response.data['voucher_type'] == 'freeshippingvoucher'
 
-    def test_list_includes_all_voucher_types(self, admin_client):
+    def test_list_includes_all_voucher_types(self, admin_client, voucher_mix):
         """Test list endpoint includes all voucher types."""
-        # Arrange
-        PercentageDiscountVoucherFactory()
-        FixedAmountVoucherFactory()
-        FreeShippingVoucherFactory()
-        url = reverse('voucher-list')
-
         # Act
-        response = admin_client.get(url)
+        response = admin_client.get(list_url())
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -397,3 +521,24 @@ class TestVoucherViewSetPolymorphism:
         assert 'percentagediscountvoucher' in voucher_types
         assert 'fixedamountvoucher' in voucher_types
         assert 'freeshippingvoucher' in voucher_types
+
+
+@pytest.mark.django_db
+class TestVoucherViewSetUsages:
+    """Test suite for the VoucherViewSet usages action."""
+
+    def test_usages_are_paginated_newest_first(self, admin_client):
+        """Test usage history is returned as a page, newest usage first."""
+        # Arrange
+        voucher = PercentageDiscountVoucherFactory()
+        usages = VoucherUsageFactory.create_batch(3, voucher=voucher)
+        url = reverse('voucher-usages', kwargs={'pk': voucher.id})
+
+        # Act
+        response = admin_client.get(url)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        assert [u['id'] for u in response.data['results']] == [u.id for u in reversed(usages)]
+        assert all(u['voucher_code'] == voucher.code for u in response.data['results'])
@@ -3,7 +3,7 @@ URL routing for vouchers app.
 """
 
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from apps.vouchers.views import (
     VoucherViewSet,
@@ -14,7 +14,7 @@ from apps.vouchers.views import (
 )
 
 # Create router and register viewsets
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'vouchers', VoucherViewSet, basename='voucher')
 router.register(r'percentage-vouchers', PercentageDiscountVoucherViewSet, basename='percentage-voucher')
 router.register(r'fixed-amount-vouchers', FixedAmountVoucherViewSet, basename='fixed-amount-voucher')
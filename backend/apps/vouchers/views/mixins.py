@@ -0,0 +1,60 @@
+"""
+Shared behaviour for the voucher viewsets.
+"""
+
+from django.utils.functional import cached_property
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import filters
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+
+# Filter backends shared by every voucher viewset that supports search.
+VOUCHER_FILTER_BACKENDS = (DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter)
+
+
+class StaffRoleMixin:
+    """
+    Evaluate the requesting user's voucher staff role once per request.
+
+    DRF creates a new view instance for every request, so the memoized
+    value never outlives the request it was computed for.
+    """
+
+    @cached_property
+    def is_staff_role(self):
+        """
+        Whether the requesting user is an admin or a manager.
+        """
+        user = self.request.user
+        return bool(user.is_authenticated and (user.is_admin or user.is_manager))
+
+
+class VoucherAdminPermissionMixin(StaffRoleMixin):
+    """
+    Permissions and creation rules shared by the voucher viewsets.
+
+    Any authenticated user may read, only admins may delete, and only
+    admins and managers may create vouchers.
+    """
+
+    def get_permissions(self):
+        """
+        Set permissions based on action.
+        """
+        if self.action == 'destroy':
+            # Only admins can delete vouchers
+            permission_classes = [IsAdminUser]
+        else:
+            # Everyone authenticated can read; creation is checked below
+            permission_classes = [IsAuthenticated]
+
+        return [permission() for permission in permission_classes]
+
+    def perform_create(self, serializer):
+        """
+        Save voucher with created_by set to current user.
+        """
+        if not self.is_staff_role:
+            raise PermissionDenied("Only admins and managers can create vouchers.")
+
+        return serializer.save(created_by=self.request.user)
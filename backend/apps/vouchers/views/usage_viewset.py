@@ -18,17 +18,17 @@ class VoucherUsageViewSet(viewsets.ReadOnlyModelViewSet):
     """
     queryset = VoucherUsage.objects.all()
     serializer_class = VoucherUsageSerializer
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['voucher', 'user']
-    ordering_fields = ['used_at', 'purchase_amount', 'discount_applied']
-    ordering = ['-used_at']
+    filter_backends = (DjangoFilterBackend, filters.OrderingFilter)
+    filterset_fields = ('voucher', 'user')
+    ordering_fields = ('used_at', 'purchase_amount', 'discount_applied')
+    ordering = ('-used_at',)
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         """
         Optimize queryset and filter based on user permissions.
         """
-        queryset = super().get_queryset().select_related('voucher', 'user')
+        queryset = self.serializer_class.setup_eager_loading(super().get_queryset())
 
         # Admins can see all usage records
         if self.request.user.is_admin:
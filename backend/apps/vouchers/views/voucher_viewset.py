@@ -2,33 +2,91 @@
 ViewSet for polymorphic Voucher models with proper optimizations.
 """
 
-from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import viewsets, status, filters
+from django.core.cache import cache
+from django.http import Http404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import viewsets, status
 from rest_framework.decorators import action
-from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from apps.vouchers.enums import VoucherStatus
 from apps.vouchers.models import (
-    Voucher,
-    PercentageDiscountVoucher,
     FixedAmountVoucher,
     FreeShippingVoucher,
+    PercentageDiscountVoucher,
+    Voucher,
 )
+from apps.vouchers.models.managers import VOUCHER_LIST_CACHE_TIMEOUT, voucher_list_cache_key
 from apps.vouchers.serializers import (
     VoucherSerializer,
     VoucherCreateSerializer,
     PercentageDiscountVoucherSerializer,
     FixedAmountVoucherSerializer,
     FreeShippingVoucherSerializer,
+    PolymorphicVoucherSerializer,
     VoucherListSerializer,
     VoucherUsageSerializer,
     VoucherUsageCreateSerializer,
     VoucherValidateSerializer,
 )
+from apps.vouchers.views.mixins import VOUCHER_FILTER_BACKENDS, VoucherAdminPermissionMixin
+
+# Concrete voucher class -> serializer for detail actions
+_DETAIL_SERIALIZERS = {
+    PercentageDiscountVoucher: PercentageDiscountVoucherSerializer,
+    FixedAmountVoucher: FixedAmountVoucherSerializer,
+    FreeShippingVoucher: FreeShippingVoucherSerializer,
+}
 
 
-class VoucherViewSet(viewsets.ModelViewSet):
+def _last_modified(voucher, now):
+    """
+    Return when a voucher's representation last changed, as a timestamp.
+
+    is_valid and is_expired flip when valid_from or valid_until passes
+    without the row being saved, so those moments count as changes too.
+
+    Args:
+        voucher: The voucher being served
+        now: The current time
+
+    Returns:
+        int: Seconds since the epoch
+    """
+    changed = voucher.updated_at
+    for boundary in (voucher.valid_from, voucher.valid_until):
+        if boundary and changed < boundary <= now:
+            changed = boundary
+    return int(changed.timestamp())
+
+
+def _list_cache_timeout(vouchers, now):
+    """
+    Return how long a rendered list page may stay cached, in seconds.
+
+    Capped at the next valid_from or valid_until among the page's vouchers,
+    since is_valid and is_expired flip there without any write.
+
+    Args:
+        vouchers: The vouchers rendered on the page
+        now: The time the page was rendered
+
+    Returns:
+        int: Seconds to cache the page for; 0 means do not cache it
+    """
+    timeout = VOUCHER_LIST_CACHE_TIMEOUT
+    for voucher in vouchers:
+        for boundary in (voucher.valid_from, voucher.valid_until):
+            if boundary and boundary >= now:
+                timeout = min(timeout, (boundary - now).total_seconds())
+    return int(timeout)
+
+
+class VoucherViewSet(VoucherAdminPermissionMixin, viewsets.ModelViewSet):
     """
     ViewSet for polymorphic Voucher models with proper optimizations.
 
@@ -44,32 +102,54 @@ class VoucherViewSet(viewsets.ModelViewSet):
     - use_voucher: Record voucher usage
     """
     queryset = Voucher.objects.all()
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['status', 'polymorphic_ctype']
-    search_fields = ['code', 'name', 'description']
-    ordering_fields = ['created_at', 'valid_from', 'valid_until', 'usage_count']
-    ordering = ['-created_at']
+    filter_backends = VOUCHER_FILTER_BACKENDS
+    filterset_fields = ('status', 'polymorphic_ctype')
+    search_fields = ('code', 'name', 'description')
+    ordering_fields = ('created_at', 'valid_from', 'valid_until', 'usage_count')
+    ordering = ('-created_at',)
 
     def get_queryset(self):
         """
         Optimize queryset with select_related and prefetch_related.
+
+        Built once per request: serializer selection and get_object() both
+        ask for it on detail actions. Callers always clone it through
+        filter_queryset() or further filtering, so it is never evaluated.
         """
-        queryset = super().get_queryset()
-
-        # Always select related created_by to prevent N+1 queries
-        queryset = queryset.select_related('created_by', 'polymorphic_ctype')
-
-        # Filter based on user role
-        if self.request.user.is_authenticated:
-            if self.request.user.is_admin or self.request.user.is_manager:
-                # Admins and managers can see all vouchers
-                return queryset
-            else:
-                # Regular users can only see active, valid vouchers
-                return queryset.filter(status=VoucherStatus.ACTIVE)
+        cached = getattr(self, '_queryset_cache', None)
+        if cached is not None and cached[0] is self.request:
+            return cached[1]
+
+        if not self.request.user.is_authenticated:
+            # Anonymous users can't access vouchers; skip the eager loading
+            queryset = Voucher.objects.none()
         else:
-            # Anonymous users can't access vouchers
-            return queryset.none()
+            # Always select related created_by to prevent N+1 queries
+            queryset = VoucherSerializer.setup_eager_loading(super().get_queryset())
+
+            # Admins and managers can see all vouchers; regular users can
+            # only see active, valid vouchers
+            if not self.is_staff_role:
+                queryset = queryset.filter(status=VoucherStatus.ACTIVE)
+
+        self._queryset_cache = (self.request, queryset)
+        return queryset
+
+    def get_object(self):
+        """
+        Return the voucher addressed by the URL, looked up once per request.
+
+        Detail actions resolve it in get_serializer_class() to pick the
+        type-specific serializer and again in the action itself.
+        """
+        lookup = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        cached = getattr(self, '_object_cache', None)
+        if cached is not None and cached[0] == lookup:
+            return cached[1]
+
+        obj = super().get_object()
+        self._object_cache = (lookup, obj)
+        return obj
 
     def get_serializer_class(self):
         """
@@ -85,15 +165,13 @@ class VoucherViewSet(viewsets.ModelViewSet):
         if self.action in ['retrieve', 'update', 'partial_update']:
             try:
                 obj = self.get_object()
-                voucher_type = obj.polymorphic_ctype.model
-
-                if voucher_type == 'percentagediscountvoucher':
-                    return PercentageDiscountVoucherSerializer
-                elif voucher_type == 'fixedamountvoucher':
-                    return FixedAmountVoucherSerializer
-                elif voucher_type == 'freeshippingvoucher':
-                    return FreeShippingVoucherSerializer
-            except:
+                # get_object() returns the concrete instance, so its class
+                # identifies the type without touching polymorphic_ctype
+                serializer_class = _DETAIL_SERIALIZERS.get(type(obj))
+                if serializer_class is not None:
+                    return serializer_class
+            except (Http404, PermissionDenied):
+                # Let the action's own get_object() call report the error
                 pass
 
         # Default serializer for list and other actions
@@ -101,70 +179,55 @@ class VoucherViewSet(viewsets.ModelViewSet):
         # polymorphic-specific fields, but we'll override list() to handle this
         return VoucherSerializer
 
-    def get_permissions(self):
-        """
-        Set permissions based on action.
+    def retrieve(self, request, *args, **kwargs):
         """
-        if self.action in ['create', 'update', 'partial_update']:
-            # Only admins and managers can create/update vouchers
-            permission_classes = [IsAuthenticated]
-        elif self.action == 'destroy':
-            # Only admins can delete vouchers
-            permission_classes = [IsAdminUser]
-        else:
-            # Everyone authenticated can read
-            permission_classes = [IsAuthenticated]
+        Retrieve a voucher, answering conditional requests with 304.
 
-        return [permission() for permission in permission_classes]
-
-    def perform_create(self, serializer):
-        """
-        Save voucher with created_by set to current user.
+        The voucher comes from the per-request get_object() cache, so a
+        304 skips serialization without an extra query.
         """
-        # Check if user has permission to create vouchers
-        if not (self.request.user.is_admin or self.request.user.is_manager):
-            from rest_framework.exceptions import PermissionDenied
-            raise PermissionDenied("Only admins and managers can create vouchers.")
+        last_modified = _last_modified(self.get_object(), timezone.now())
+        not_modified = get_conditional_response(request, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
 
-        return serializer.save(created_by=self.request.user)
+        response = super().retrieve(request, *args, **kwargs)
+        response['Last-Modified'] = http_date(last_modified)
+        return response
 
     def list(self, request, *args, **kwargs):
         """
         List vouchers with proper polymorphic serialization.
+
+        Pages are cached per URL and per visibility scope, since admins and
+        managers see every voucher and everyone else only active ones. Any
+        voucher write, and any change to a user's name or email (shown as
+        created_by_name), invalidates all cached pages. A page expires no
+        later than the next validity boundary of a voucher on it.
         """
+        scope = 'all' if self.is_staff_role else 'active'
+        cache_key = voucher_list_cache_key(scope, request.build_absolute_uri())
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        now = timezone.now()
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
 
         if page is not None:
-            # Serialize each voucher with its specific serializer
-            serialized_data = []
-            for voucher in page:
-                if isinstance(voucher, PercentageDiscountVoucher):
-                    serializer = PercentageDiscountVoucherSerializer(voucher)
-                elif isinstance(voucher, FixedAmountVoucher):
-                    serializer = FixedAmountVoucherSerializer(voucher)
-                elif isinstance(voucher, FreeShippingVoucher):
-                    serializer = FreeShippingVoucherSerializer(voucher)
-                else:
-                    serializer = VoucherSerializer(voucher)
-                serialized_data.append(serializer.data)
-
-            return self.get_paginated_response(serialized_data)
-
-        # Non-paginated response
-        serialized_data = []
-        for voucher in queryset:
-            if isinstance(voucher, PercentageDiscountVoucher):
-                serializer = PercentageDiscountVoucherSerializer(voucher)
-            elif isinstance(voucher, FixedAmountVoucher):
-                serializer = FixedAmountVoucherSerializer(voucher)
-            elif isinstance(voucher, FreeShippingVoucher):
-                serializer = FreeShippingVoucherSerializer(voucher)
-            else:
-                serializer = VoucherSerializer(voucher)
-            serialized_data.append(serializer.data)
-
-        return Response(serialized_data)
+            serializer = PolymorphicVoucherSerializer(page, many=True)
+            response = self.get_paginated_response(serializer.data)
+        else:
+            # Non-paginated response
+            serializer = PolymorphicVoucherSerializer(queryset, many=True)
+            response = Response(serializer.data)
+
+        # The queryset was evaluated above, so this reads its result cache
+        timeout = _list_cache_timeout(queryset if page is None else page, now)
+        if timeout > 0:
+            cache.set(cache_key, response.data, timeout)
+        return response
 
     def create(self, request, *args, **kwargs):
         """
@@ -174,15 +237,7 @@ class VoucherViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         voucher = self.perform_create(serializer)
 
-        # Get appropriate response serializer based on voucher type
-        if isinstance(voucher, PercentageDiscountVoucher):
-            response_serializer = PercentageDiscountVoucherSerializer(voucher)
-        elif isinstance(voucher, FixedAmountVoucher):
-            response_serializer = FixedAmountVoucherSerializer(voucher)
-        elif isinstance(voucher, FreeShippingVoucher):
-            response_serializer = FreeShippingVoucherSerializer(voucher)
-        else:
-            response_serializer = VoucherSerializer(voucher)
+        response_serializer = PolymorphicVoucherSerializer(voucher)
 
         headers = self.get_success_headers(response_serializer.data)
         return Response(
@@ -196,8 +251,7 @@ class VoucherViewSet(viewsets.ModelViewSet):
         Update voucher with permission check.
         """
         # Check if user has permission to update vouchers
-        if not (self.request.user.is_admin or self.request.user.is_manager):
-            from rest_framework.exceptions import PermissionDenied
+        if not self.is_staff_role:
             raise PermissionDenied("Only admins and managers can update vouchers.")
 
         serializer.save()
@@ -220,15 +274,7 @@ class VoucherViewSet(viewsets.ModelViewSet):
         voucher = serializer.validated_data['voucher']
         calculated_discount = serializer.validated_data['calculated_discount']
 
-        # Use polymorphic serializer for voucher
-        if isinstance(voucher, PercentageDiscountVoucher):
-            voucher_serializer = PercentageDiscountVoucherSerializer(voucher)
-        elif isinstance(voucher, FixedAmountVoucher):
-            voucher_serializer = FixedAmountVoucherSerializer(voucher)
-        elif isinstance(voucher, FreeShippingVoucher):
-            voucher_serializer = FreeShippingVoucherSerializer(voucher)
-        else:
-            voucher_serializer = VoucherSerializer(voucher)
+        voucher_serializer = PolymorphicVoucherSerializer(voucher)
 
         return Response({
             'valid': True,
@@ -239,23 +285,31 @@ class VoucherViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated])
     def usages(self, request, pk=None):
         """
-        Get usage history for a specific voucher.
+        Get usage history for a specific voucher, newest first.
 
         GET /api/vouchers/{id}/usages/
+
+        Paginated like the list endpoint.
         """
         voucher = self.get_object()
 
         # Only admins/managers and voucher creator can see usage history
-        if not (request.user.is_admin or request.user.is_manager or
-                voucher.created_by == request.user):
+        if not (self.is_staff_role or voucher.created_by_id == request.user.id):
             return Response(
                 {'detail': 'You do not have permission to view this voucher\'s usage history.'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        usages = voucher.usages.select_related('user', 'voucher').order_by('-used_at')
-        serializer = VoucherUsageSerializer(usages, many=True)
+        # The related manager attaches this voucher to every usage, and the
+        # list serializer fetches the page's users in one query, so no
+        # joins are needed
+        usages = voucher.usages.order_by('-used_at')
+        page = self.paginate_queryset(usages)
+        if page is not None:
+            serializer = VoucherUsageSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
 
+        serializer = VoucherUsageSerializer(usages, many=True)
         return Response(serializer.data)
 
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
@@ -32,10 +32,16 @@ TEMPLATES[0]['OPTIONS']['debug'] = True  # noqa: F405
 # Email backend for development
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
-# Cache backend for development
+# Cache backend for development; sized so voucher lookups and list pages
+# are not culled during profiling sessions
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'KEY_PREFIX': 'dev',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+            'CULL_FREQUENCY': 10,
+        },
     }
 }
 
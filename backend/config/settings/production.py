@@ -17,6 +17,11 @@ SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_PRELOAD = True
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 
+# Keep database connections open between requests; health checks discard
+# connections the server has closed before they are reused
+DATABASES['default']['CONN_MAX_AGE'] = env.int('CONN_MAX_AGE', default=60)  # noqa: F405
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True  # noqa: F405
+
 # Caching with Redis
 CACHES = {
     'default': {
@@ -26,9 +31,12 @@ CACHES = {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
             'SOCKET_CONNECT_TIMEOUT': 5,
             'SOCKET_TIMEOUT': 5,
-            'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+            'COMPRESSOR': 'django_redis.compressors.lz4.Lz4Compressor',
             'IGNORE_EXCEPTIONS': True,
-        }
+        },
+        # Bumped when the value encoding changes so entries written with the
+        # previous compressor are never decoded (v1: zlib, v2: lz4)
+        'VERSION': 2,
     }
 }
 
@@ -39,7 +47,16 @@ SESSION_CACHE_ALIAS = 'default'
 # Static files using WhiteNoise
 MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')  # noqa: F405
 
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# STATICFILES_STORAGE was removed in Django 5.1; configure via STORAGES.
+# collectstatic writes .br alongside .gz files when brotli is installed.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 # Logging with structured output
 LOGGING = {
@@ -9,13 +9,19 @@ PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
 ]
 
-# Use in-memory SQLite for faster tests
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': ':memory:',
+# Use in-memory SQLite for faster tests; set TEST_DB=pg to run against
+# the DATABASE_URL database instead (e.g. for integration jobs)
+if env('TEST_DB', default='') == 'pg':  # noqa: F405
+    DATABASES = {
+        'default': env.db('DATABASE_URL'),  # noqa: F405
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
     }
-}
 
 # Disable migrations for faster tests
 class DisableMigrations: